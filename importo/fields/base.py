@@ -7,7 +7,7 @@ from django.utils.translation import gettext_lazy as _
 
 from importo.constants import EMPTY_VALUES, NOT_SPECIFIED
 from importo.exceptions import SkipField, SkipRow
-from importo.parsers import BaseParser
+from importo.parsers.base import BaseParser
 from importo.utils.classes import CommandBoundObject, CopyableMixin
 from importo.utils.values import ValueExtractionError, extract_row_value
 
@@ -279,7 +279,7 @@ class Field(CopyableMixin, CommandBoundObject):
             return raw_value
         return self.clean(raw_value)
 
-    def extract_value(self, key: str, raw_data: Any) -> Tuple(Any, bool):
+    def extract_value(self, key: str, raw_data: Any) -> Tuple[Any, bool]:
         """
         Attempt to extract a value from `raw_data` using `key`. If the value is missing
         or empty, raise some kind of error, or return a different value according to the
@@ -448,8 +448,8 @@ class BaseParsedField(Field):
         return {"command": self.command}
 
     def to_python(self, value):
-        parser = self.get_parser()
-        value = parser.parse(str(value))
+        with self.get_parser() as parser:
+            value = parser.parse(str(value))
         # TODO: Find a better way to surface / persist parser errors/warnings
         if parser.messages:
             self.log_debug(
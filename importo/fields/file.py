@@ -1,7 +1,8 @@
 import os
 import sys
+from concurrent.futures import Executor
 from io import BytesIO
-from typing import Any, Dict, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
 
 import PIL
 from django.core.exceptions import ValidationError
@@ -12,7 +13,7 @@ from django.utils.translation import gettext_lazy as _
 
 from importo.constants import NOT_SPECIFIED
 from importo.exceptions import SkipField, SkipRow
-from importo.utils.io import fetch_file, filename_from_url, static_file_to_bytesio
+from importo.utils.io import PrefetchedFiles, filename_from_url, static_file_to_bytesio
 
 from . import base, constants, error_codes, strategy_codes
 
@@ -75,8 +76,16 @@ class FileField(base.Field):
         self.on_file_invalid = on_file_invalid
         self.max_retries = max_retries
         self.max_filesize = max_filesize
+        # Downloads started by prefetch()
+        self._prefetched = PrefetchedFiles()
         super().__init__(*args, **kwargs)
 
+    def __copy__(self):
+        new = super().__copy__()
+        # Copies should not share downloads started by prefetch()
+        new._prefetched = PrefetchedFiles()
+        return new
+
     @property
     def on_download_error(self):
         """
@@ -169,14 +178,42 @@ class FileField(base.Field):
     def use_dummy_file(self):
         return getattr(self.command, "mock_downloads", False)
 
-    def to_python(self, value: Any) -> UploadedFile:
-        if isinstance(value, UploadedFile):
-            return value
-
+    def get_download_url(self, value: Any) -> str:
         # Ensure value is a string, and make replacements
         value = str(value)
         for _find, _replace in self.file_path_replace:
             value = value.replace(_find, _replace)
+        return value
+
+    def prefetch(self, values: Iterable[Any], executor: Executor) -> None:
+        """
+        Start downloading the files for ``values`` using ``executor``, so that
+        later ``clean()`` calls for the same values can pick up the result
+        instead of downloading them again. Only the network fetch runs in the
+        executor; error handling, validation and anything else touching the
+        database still happen in the thread that calls ``clean()``.
+        """
+        if self.use_dummy_file:
+            return
+        self._prefetched.prefetch(
+            (self.get_download_url(value) for value in values),
+            executor,
+            add_hash=True,
+            max_retries=self.max_retries,
+        )
+
+    def clear_prefetched(self) -> None:
+        """
+        Discard any downloads started by ``prefetch()`` that have not yet been
+        picked up by ``clean()``.
+        """
+        self._prefetched.clear()
+
+    def to_python(self, value: Any) -> UploadedFile:
+        if isinstance(value, UploadedFile):
+            return value
+
+        value = self.get_download_url(value)
 
         if self.use_dummy_file:
             self.log_debug(f"Using dummy file for '{self.target_field}'")
@@ -184,7 +221,10 @@ class FileField(base.Field):
 
         try:
             self.log_debug(f"Downloading: {value}")
-            file = fetch_file(value, add_hash=True, max_retries=self.max_retries)
+            # Picks up the result of prefetch() for this value (if any)
+            file = self._prefetched.fetch(
+                value, add_hash=True, max_retries=self.max_retries
+            )
         except Exception as e:
             self.log_debug(f"Encountered error while downloading: {e}")
             strategy = self.on_download_error
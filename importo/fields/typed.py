@@ -60,7 +60,7 @@ class TextField(BaseTypedField):
     on_max_length_exceeded_default = strategy_codes.RAISE_ERROR
 
     default_error_messages = {
-        strategy_codes.MAX_LENGTH_EXCEEDED: _(
+        error_codes.MAX_LENGTH_EXCEEDED: _(
             "The value is %(value_length)s characters long, which exceeds the %(max_length)s character limit."
         ),
     }
@@ -33,6 +33,7 @@ class BaseFinder(CommandBoundObject):
     def __init__(self, command: "BaseCommand"):
         super().__init__(command)
         self.result_cache = {}
+        self.pk_cache = {}
         # Generate a list of lookup options that are bound to this instance.
         # We doing this here means that errors can be raised on finder
         # initialization, which is much more obvious than generating lazily
@@ -91,7 +92,7 @@ class BaseFinder(CommandBoundObject):
 
         - ``get_from_cache(self, lookup_value)``
         - ``get_single_match(self, lookup_value)``
-        - ``add_to_cache(self, lookup_value)``
+        - ``add_to_cache(self, lookup_value, result)``
         """
         if isinstance(value, LookupValue):
             lookup_value = value
@@ -116,28 +117,74 @@ class BaseFinder(CommandBoundObject):
         # Try to get a match from the database
         try:
             result = self.get_single_match(lookup_value)
-            self.add_to_cache(result, lookup_value)
+            self.add_to_cache(lookup_value, result)
         except ObjectDoesNotExist:
             if self.cache_lookup_failures:
-                self.add_to_cache(None, lookup_value)
+                self.add_to_cache(lookup_value, None)
             raise not_found
         return result
 
-    def get_single_match(self, lookup_value: LookupValue) -> Model:
+    def find_pk(self, value: Any) -> Any:
+        """
+        Return the primary key of a single object matching the supplied value. Useful
+        when only a reference to the object is needed (e.g. for richtext links), as
+        only the primary key is fetched from the database.
+
+        Raises ``LookupValueNotSupported`` if the value is unsuitable for all of the available lookup options.
+
+        Raises ``ObjectDoesNotExist`` if no such model instance can be found.
+        """
+        if isinstance(value, LookupValue):
+            lookup_value = value
+        else:
+            lookup_value = self.get_lookup_value(value)
+
+        not_found = self.model.DoesNotExist(
+            f"No {self.model} was found matching '{lookup_value.raw}'."
+        )
+
+        # Reuse results from find() where possible
+        try:
+            result = self.get_from_cache(lookup_value)
+            if result is not None:
+                return result.pk
+            else:
+                raise not_found
+        except CachedValueNotFound:
+            pass
+
+        for key in lookup_value.cache_keys:
+            if key in self.pk_cache:
+                return self.pk_cache[key]
+
+        try:
+            queryset = self.get_queryset().select_related(None).only("pk")
+            pk = self.get_single_match(lookup_value, base_queryset=queryset).pk
+        except ObjectDoesNotExist:
+            if self.cache_lookup_failures:
+                self.add_to_cache(lookup_value, None)
+            raise not_found
+
+        # Deferred instances are not added to 'result_cache', because generating
+        # cache keys from them would trigger additional queries
+        for key in lookup_value.cache_keys:
+            self.pk_cache[key] = pk
+        return pk
+
+    def get_single_match(
+        self, lookup_value: LookupValue, base_queryset: QuerySet = None
+    ) -> Model:
         """
         Return a single object from the database matching the supplied ``lookup_value``,
-        using any lookup options that are valid.
+        using the first compatible lookup option that finds a match.
 
         Raises ``ObjectDoesNotExist`` if no match can be found.
         """
-        base_queryset = self.get_queryset()
-        for option in lookup_value.valid_lookup_options:
+        if base_queryset is None:
+            base_queryset = self.get_queryset()
+        for option in lookup_value.compatible_lookup_options:
             try:
-                option.get_match(
-                    lookup_value,
-                    base_queryset,
-                    on_multiple_matches=self.on_multiple_matches,
-                )
+                return option.find(lookup_value, base_queryset)
             except ObjectDoesNotExist:
                 continue
         raise ObjectDoesNotExist
@@ -163,14 +210,23 @@ class BaseFinder(CommandBoundObject):
         raise CachedValueNotFound(f"No cached results were found for '{lookup_value}'.")
 
     def add_to_cache(
-        self, lookup_value: LookupValue, result: Union[Model, None]
+        self, lookup_value: Union[LookupValue, Any], result: Union[Model, None]
     ) -> None:
-        keys = lookup_value.cache_keys
+        """
+        Add ``result`` to this finder's 'lookup cache' for ``lookup_value``, which can
+        be a ``LookupValue`` or a raw value. A ``result`` of ``None`` indicates that
+        no match could be found.
+        """
+        if not isinstance(lookup_value, LookupValue):
+            lookup_value = LookupValue(lookup_value, self)
+        # Copy to avoid modifying the lookup value's own cache keys
+        keys = set(lookup_value.cache_keys)
         if result is not None:
-            for option in self.lookup_options:
-                keys.update(option.get_cache_keys_for_result(result))
+            for option in self.bound_lookup_options:
+                keys.update(option.get_extra_cache_keys_from_result(result))
         for key in keys:
             self.result_cache[key] = result
 
     def clear_cache(self) -> None:
         self.result_cache.clear()
+        self.pk_cache.clear()
@@ -2,4 +2,4 @@ from .base import *  # NOQA
 from .filename import *  # NOQA
 from .legacy_id import *  # NOQA
 from .modelfield import *  # NOQA
-from .uri import *  # NOQA
+from .urlpath import *  # NOQA
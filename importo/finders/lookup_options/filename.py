@@ -12,7 +12,7 @@ from importo.utils.uri import is_media_uri
 
 from .base import LookupValueError, ValueTypeIncompatible
 from .modelfield import ModelFieldLookupOption
-from .path import DomainSpecificValuesMixin, ValueDomainInvalid
+from .urlpath import DomainSpecificLookupMixin, ValueDomainInvalid
 
 __all__ = [
     "FilePathLookupOption",
@@ -24,7 +24,7 @@ class FileExtensionInvalid(LookupValueError):
     pass
 
 
-class FilePathLookupOption(DomainSpecificValuesMixin, ModelFieldLookupOption):
+class FilePathLookupOption(DomainSpecificLookupMixin, ModelFieldLookupOption):
     """
     A lookup option used to find imported objects from legacy filename values.
 
@@ -89,7 +89,7 @@ class ModelFieldLookupOption(BaseLookupOption):
                 "'on_multiple_objects_found' must be a callable or one of "
                 f"the following values (not '{value}'): {valid_choices}."
             )
-        self._on_multiple_object_returned = value
+        self._on_multiple_objects_found = value
 
     def get_model_field(self) -> Field:
         try:
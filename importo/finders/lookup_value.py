@@ -36,7 +36,7 @@ class LookupValue:
         if not self.compatible_lookup_options:
             raise LookupValueNotSupported
 
-    def get_compatible_lookup_options(self) -> Tuple(BaseLookupOption):
+    def get_compatible_lookup_options(self) -> Tuple["BaseLookupOption", ...]:
         """
         Checks this instance for compatibility with each of the finder's
         lookup options, and returns a tuple of the compatible ones.
@@ -77,7 +77,7 @@ class LookupValue:
         regardless of the specific version that is used.
         """
         keys = {self.raw}
-        for lookup in self.valid_lookup_options:
+        for lookup in self.compatible_lookup_options:
             for key in lookup.get_extra_cache_keys(self):
                 keys.add(key)
         return keys
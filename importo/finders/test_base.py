@@ -0,0 +1,85 @@
+import pytest
+from django.contrib.auth import get_user_model
+
+from .user import UserFinder
+
+User = get_user_model()
+
+
+@pytest.fixture
+def alice(db):
+    return User.objects.create(username="alice")
+
+
+@pytest.fixture
+def finder():
+    return UserFinder(None)
+
+
+def test_find(alice, finder, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        assert finder.find("alice") == alice
+        # Repeat lookups are served from the cache
+        assert finder.find("alice") == alice
+
+
+def test_find_caches_failures(db, finder, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        for i in range(2):
+            with pytest.raises(User.DoesNotExist):
+                finder.find("bob")
+    assert finder.result_cache == {"bob": None}
+
+
+def test_find_without_caching_failures(db, finder, django_assert_num_queries):
+    finder.cache_lookup_failures = False
+    with django_assert_num_queries(2):
+        for i in range(2):
+            with pytest.raises(User.DoesNotExist):
+                finder.find("bob")
+    assert finder.result_cache == {}
+
+
+def test_find_pk(alice, finder, django_assert_num_queries):
+    with django_assert_num_queries(1) as context:
+        assert finder.find_pk("alice") == alice.pk
+        # Repeat lookups are served from the pk cache
+        assert finder.find_pk("alice") == alice.pk
+    # Only the primary key is fetched from the database
+    sql = context.captured_queries[0]["sql"]
+    assert sql.startswith('SELECT "auth_user"."id" FROM')
+    # Deferred instances are kept out of the result cache
+    assert finder.pk_cache == {"alice": alice.pk}
+    assert finder.result_cache == {}
+
+
+def test_find_pk_reuses_result_cache(alice, finder, django_assert_num_queries):
+    finder.find("alice")
+    with django_assert_num_queries(0):
+        assert finder.find_pk("alice") == alice.pk
+
+
+def test_find_pk_caches_failures(db, finder, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        with pytest.raises(User.DoesNotExist):
+            finder.find_pk("bob")
+        with pytest.raises(User.DoesNotExist):
+            finder.find("bob")
+
+
+def test_add_to_cache(alice, finder, django_assert_num_queries):
+    finder.add_to_cache("alice", alice)
+    with django_assert_num_queries(0):
+        assert finder.find("alice") == alice
+        assert finder.find_pk("alice") == alice.pk
+
+
+def test_clear_cache(alice, finder, django_assert_num_queries):
+    finder.find_pk("alice")
+    with pytest.raises(User.DoesNotExist):
+        finder.find("bob")
+    finder.clear_cache()
+    assert finder.result_cache == {}
+    assert finder.pk_cache == {}
+    with django_assert_num_queries(1):
+        assert finder.find_pk("alice") == alice.pk
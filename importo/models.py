@@ -7,6 +7,16 @@ from django.utils.translation import gettext_lazy as _
 from importo.utils.uri import extract_host_and_path
 
 
+class LegacyModelMixin:
+    """
+    A mixin for models that store the ID of the object they were imported
+    from in one of their own fields. Subclasses should set ``LEGACY_ID_FIELD``
+    to the name of that field. Used by finders to find objects by legacy ID.
+    """
+
+    LEGACY_ID_FIELD = "legacy_id"
+
+
 class BaseImportedEntity(models.Model):
     """
     An abstract base model for storing details about entities that have been
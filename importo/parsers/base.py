@@ -1,12 +1,16 @@
 import warnings
-from typing import Any
+from typing import TYPE_CHECKING, Any, Union
 
 import bs4
 from django.utils.functional import cached_property
-from tate.legacy.finders import DocumentFinder, ImageFinder, PageFinder
-from tate.legacy.utils.classes import CommandBoundObject
+from django.utils.module_loading import import_string
 from wagtail.images import get_image_model
 
+from importo.utils.classes import CommandBoundObject
+
+if TYPE_CHECKING:
+    from tate.legacy.finders import DocumentFinder, ImageFinder, PageFinder
+
 Image = get_image_model()
 
 
@@ -14,6 +18,19 @@ class BaseParser(CommandBoundObject):
     def parse(self, value: Any) -> Any:
         self.messages = []
 
+    def close(self) -> None:
+        """
+        Release any resources (e.g. worker threads) held by the parser. Parsers
+        can also be used as context managers to have this called automatically.
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     @staticmethod
     def get_soup(value: str) -> bs4.BeautifulSoup:
         """
@@ -26,16 +43,21 @@ class BaseParser(CommandBoundObject):
         consistant results than the default.
         """
         soup = bs4.BeautifulSoup(value, features="lxml")
-        # Remove body, head and html tags (likely added by bs4)
-        for elem in soup.find_all("body"):
-            elem.unwrap()
-        for elem in soup.find_all("head"):
-            elem.unwrap()
-        for elem in soup.find_all("html"):
-            elem.unwrap()
+        # Remove body, head and html tags (likely added by bs4). lxml only ever
+        # places these at the top of the tree, so there's no need to search
+        # the rest of the document for them.
+        for html in soup.find_all("html", recursive=False):
+            for elem in html.find_all(["head", "body"], recursive=False):
+                elem.unwrap()
+            html.unwrap()
         return soup
 
-    def get_or_create_finder(self, key: str, finder_class: type):
+    def get_or_create_finder(self, key: str, finder_class: Union[type, str]):
+        """
+        Return the finder instance the bound command shares under ``key``, or
+        create a new instance of ``finder_class`` (which can be a class or an
+        import path) if the command has no such finder.
+        """
         try:
             return self.command.finders[key]
         except AttributeError:
@@ -50,19 +72,23 @@ class BaseParser(CommandBoundObject):
                 f"finder instance matching the key '{key}', so the "
                 f"{type(self).__name__} is creating its own {finder_class} instance."
             )
+        if isinstance(finder_class, str):
+            finder_class = import_string(finder_class)
         return finder_class()
 
     @cached_property
-    def page_finder(self) -> PageFinder:
-        return self.get_or_create_finder("pages", PageFinder)
+    def page_finder(self) -> "PageFinder":
+        return self.get_or_create_finder("pages", "tate.legacy.finders.PageFinder")
 
     @cached_property
-    def document_finder(self) -> DocumentFinder:
-        return self.get_or_create_finder("documents", DocumentFinder)
+    def document_finder(self) -> "DocumentFinder":
+        return self.get_or_create_finder(
+            "documents", "tate.legacy.finders.DocumentFinder"
+        )
 
     @cached_property
-    def image_finder(self) -> ImageFinder:
-        return self.get_or_create_finder("images", ImageFinder)
+    def image_finder(self) -> "ImageFinder":
+        return self.get_or_create_finder("images", "tate.legacy.finders.ImageFinder")
 
     def find_image(self, value: Any):
         """
@@ -77,6 +103,12 @@ class BaseParser(CommandBoundObject):
     def fallback_image(self):
         return Image.objects.all().first()
 
+    @cached_property
+    def fallback_image_pk(self):
+        image = self.fallback_image
+        if image is not None:
+            return image.pk
+
     def find_document(self, value: Any):
         """
         Return a Wagtail document instance matching a supplied 'legacy system ID' value,
@@ -86,6 +118,16 @@ class BaseParser(CommandBoundObject):
         """
         return self.document_finder.find(value)
 
+    def find_document_pk(self, value: Any):
+        """
+        Return the primary key of a Wagtail document matching a supplied 'legacy system ID'
+        value, or path/filename string. Cheaper than ``find_document()`` when only a
+        reference to the document is needed.
+
+        Raises ``django.core.exceptions.ObjectDoesNotExist`` if no such document can be found.
+        """
+        return self._find_pk(self.document_finder, value)
+
     def find_page(self, value: Any):
         """
         Return a Wagtail ``Page`` instance matching a supplied 'legacy system ID' value,
@@ -95,6 +137,23 @@ class BaseParser(CommandBoundObject):
         """
         return self.page_finder.find(value)
 
+    def find_page_pk(self, value: Any):
+        """
+        Return the primary key of a Wagtail ``Page`` matching a supplied 'legacy system ID'
+        value, url or path string. Cheaper than ``find_page()`` when only a reference to
+        the page is needed.
+
+        Raises ``Page.DoesNotExist`` if no such page can be found.
+        """
+        return self._find_pk(self.page_finder, value)
+
+    @staticmethod
+    def _find_pk(finder, value: Any):
+        if hasattr(finder, "find_pk"):
+            return finder.find_pk(value)
+        # Not all finders support pk-only lookups, but all can find the object
+        return finder.find(value).pk
+
 
 class BaseRichTextContainingParser(BaseParser):
     richtext_parse_class = None
@@ -104,6 +163,9 @@ class BaseRichTextContainingParser(BaseParser):
         return self.richtext_parse_class(self.command)
 
     def parse_richtext(self, value: str) -> str:
+        if not value:
+            # Avoid a parser round-trip for empty values (e.g. missing captions)
+            return ""
         value = self.richtext_parser.parse(value)
         self.messages.extend(self.richtext_parser.messages)
         return value
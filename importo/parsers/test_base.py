@@ -0,0 +1,96 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+from django.core.exceptions import ObjectDoesNotExist
+
+from importo.fields.base import BaseParsedField
+
+from .base import BaseParser
+
+DOCUMENT = SimpleNamespace(pk=1)
+PAGE = SimpleNamespace(pk=2)
+
+
+class ObjectFinder:
+    """
+    A finder that can only return whole objects (like those provided by
+    projects that predate ``find_pk()``).
+    """
+
+    def __init__(self, objects=None):
+        self.objects = objects or {}
+        self.calls = []
+
+    def find(self, value):
+        self.calls.append(("find", value))
+        try:
+            return self.objects[value]
+        except KeyError:
+            raise ObjectDoesNotExist
+
+
+class PKFinder(ObjectFinder):
+    def find_pk(self, value):
+        self.calls.append(("find_pk", value))
+        try:
+            return self.objects[value].pk
+        except KeyError:
+            raise ObjectDoesNotExist
+
+
+def get_parser(finder_class):
+    command = SimpleNamespace(
+        logger=logging.getLogger(__name__),
+        finders={
+            "documents": finder_class({"/files/report.pdf": DOCUMENT}),
+            "pages": finder_class({"/about/": PAGE}),
+        },
+    )
+    return BaseParser(command)
+
+
+@pytest.mark.parametrize("finder_class", [ObjectFinder, PKFinder])
+def test_find_pk(finder_class):
+    parser = get_parser(finder_class)
+    assert parser.find_document_pk("/files/report.pdf") == 1
+    assert parser.find_page_pk("/about/") == 2
+    expected_method = "find_pk" if finder_class is PKFinder else "find"
+    assert parser.document_finder.calls == [(expected_method, "/files/report.pdf")]
+    assert parser.page_finder.calls == [(expected_method, "/about/")]
+
+
+@pytest.mark.parametrize("finder_class", [ObjectFinder, PKFinder])
+def test_find_pk_not_found(finder_class):
+    parser = get_parser(finder_class)
+    with pytest.raises(ObjectDoesNotExist):
+        parser.find_document_pk("/files/missing.pdf")
+    with pytest.raises(ObjectDoesNotExist):
+        parser.find_page_pk("/missing/")
+
+
+def test_get_or_create_finder_from_import_path():
+    parser = BaseParser(SimpleNamespace(logger=logging.getLogger(__name__), finders={}))
+    with pytest.warns(UserWarning, match="cannot share a finder instance"):
+        finder = parser.get_or_create_finder(
+            "things", "importo.parsers.test_base.PKFinder"
+        )
+    assert isinstance(finder, PKFinder)
+
+
+class ClosingParser(BaseParser):
+    closed = False
+
+    def parse(self, value):
+        super().parse(value)
+        return value.upper()
+
+    def close(self):
+        self.closed = True
+
+
+def test_parsed_field_closes_parser():
+    parser = ClosingParser()
+    field = BaseParsedField(source="body", parser=lambda **kwargs: parser)
+    assert field.to_python("value") == "VALUE"
+    assert parser.closed
@@ -0,0 +1,32 @@
+from django.db import models
+from wagtail.models import Page
+
+
+class LegacyPage(Page):
+    LEGACY_ID_FIELD = "legacy_id"
+
+    legacy_id = models.PositiveIntegerField(null=True, blank=True)
+    legacy_path = models.CharField(max_length=255, null=True, blank=True)
+
+
+class LegacyEventPage(LegacyPage):
+    """
+    A legacy page type that inherits its legacy fields from a parent.
+    """
+
+    venue = models.CharField(max_length=255, blank=True)
+
+
+class LegacyArticlePage(Page):
+    LEGACY_ID_FIELD = "legacy_nid"
+
+    legacy_nid = models.PositiveIntegerField(null=True, blank=True)
+    legacy_path = models.CharField(max_length=255, null=True, blank=True)
+
+
+class StandardPage(Page):
+    """
+    A page type without any legacy fields.
+    """
+
+    body = models.TextField(blank=True)
@@ -34,6 +34,7 @@ INSTALLED_APPS = (
 )
 
 ROOT_URLCONF = "importo.testapp.urls"
+STATIC_URL = "/static/"
 SECRET_KEY = "fake-key"
 
 # Django i18n
@@ -1,14 +1,40 @@
 import hashlib
 import io
 import os
+import threading
+from concurrent.futures import Executor, Future
+from typing import Dict, Iterable
 from urllib import parse
 
 import requests
 from django.contrib.staticfiles import finders
+from requests.adapters import HTTPAdapter
 
+_local = threading.local()
 
-def fetch_file(url: str, add_hash=True) -> io.BytesIO:
-    response = requests.get(url, verify=False, stream=not add_hash)
+
+def get_session(max_retries: int = 0) -> requests.Session:
+    """
+    Return a ``requests.Session`` for the current thread, so that connections
+    can be reused between downloads. Sessions are not shared between threads,
+    so this is safe to use when downloading files concurrently.
+    """
+    sessions = getattr(_local, "sessions", None)
+    if sessions is None:
+        sessions = _local.sessions = {}
+    try:
+        return sessions[max_retries]
+    except KeyError:
+        session = requests.Session()
+        adapter = HTTPAdapter(max_retries=max_retries)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        sessions[max_retries] = session
+        return session
+
+
+def fetch_file(url: str, add_hash=True, max_retries: int = 0) -> io.BytesIO:
+    response = get_session(max_retries).get(url, verify=False, stream=not add_hash)
     response.raise_for_status()
     file = io.BytesIO(response.content)
     if add_hash:
@@ -16,13 +42,59 @@ def fetch_file(url: str, add_hash=True) -> io.BytesIO:
     return file
 
 
+class PrefetchedFiles:
+    """
+    Runs ``fetch_file()`` for a number of URLs in the background using an
+    ``Executor``, and hands the results over to whichever thread later calls
+    ``fetch()`` for the same URL. Any exception raised while fetching is
+    re-raised by ``fetch()``, so that it can be handled in the calling thread.
+    """
+
+    def __init__(self):
+        self._futures: Dict[str, Future] = {}
+
+    def prefetch(
+        self,
+        urls: Iterable[str],
+        executor: Executor,
+        add_hash: bool = True,
+        max_retries: int = 0,
+    ) -> None:
+        for url in urls:
+            if url not in self._futures:
+                self._futures[url] = executor.submit(
+                    fetch_file, url, add_hash=add_hash, max_retries=max_retries
+                )
+
+    def fetch(
+        self, url: str, add_hash: bool = True, max_retries: int = 0
+    ) -> io.BytesIO:
+        """
+        Return the result of a prefetched download for ``url`` (waiting for it
+        to complete if necessary), or fetch the file now if no download was
+        started. Each prefetched download is only used once.
+        """
+        future = self._futures.pop(url, None)
+        if future is None or future.cancelled():
+            return fetch_file(url, add_hash=add_hash, max_retries=max_retries)
+        return future.result()
+
+    def clear(self) -> None:
+        """
+        Discard any prefetched downloads that have not been used.
+        """
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+
+
 def filename_from_url(url) -> str:
     """
     Gets the file name from a URL and cleans it up
     "https://example.com/my%20file.jpg?token=here" becomes "my file.jpg"
     """
     url_parsed = parse.urlparse(url)
-    return parse.unquote_plus(os.path.split(url_parsed.path).pop())
+    return parse.unquote_plus(os.path.split(url_parsed.path)[-1])
 
 
 def static_file_to_bytesio(file_path: str) -> io.BytesIO:
@@ -1,126 +1,310 @@
 import functools
-import re
-from typing import Any, Dict, Set, Tuple, Type
+from types import MappingProxyType
+from typing import Any, FrozenSet, Mapping, Optional, Sequence, Tuple, Type, Union
 
-from django.core.exceptions import FieldDoesNotExist
-from django.db.models import OneToOneRel, Q
+from django.db.models import F, OneToOneRel, Q
 from django.db.models.functions import Coalesce
-from tate.legacy.models import LegacyPageMixin
 from wagtail.models import Page, get_page_models
 from wagtail.query import PageQuerySet
 
 
-def get_legacy_page_type_related_names(
-    values: Dict[Type, str], model_class: Type, known_subclasses=None, prefix=None
-):
-    if known_subclasses is None:
-        known_subclasses = set(
-            model
-            for model in get_page_models()
-            if not model._meta.abstract
-            and issubclass(model, model_class)
-            and issubclass(model, LegacyPageMixin)
-        )
+@functools.lru_cache(maxsize=None)
+def get_legacy_page_models() -> FrozenSet[Type]:
+    from tate.legacy.models import LegacyPageMixin
 
-    for rel in (
-        rel
-        for rel in model_class._meta.related_objects
-        if isinstance(rel, OneToOneRel) and rel.related_model in known_subclasses
-    ):
-        rel_name = f"{prefix}__{rel.name}" if prefix else rel.name
-        values[rel.related_model] = rel_name
-        get_legacy_page_type_related_names(
-            values, rel.related_model, known_subclasses, rel_name
-        )
-    return values
+    return frozenset(
+        model
+        for model in get_page_models()
+        if not model._meta.abstract and issubclass(model, LegacyPageMixin)
+    )
 
 
 @functools.lru_cache(maxsize=None)
-def get_concrete_subclass_related_names(model: Type) -> Dict[Type, str]:
-    return get_legacy_page_type_related_names({}, model)
+def get_concrete_subclass_related_names(model: Type) -> Mapping[Type, str]:
+    """
+    Return a mapping of the concrete legacy page subclasses of ``model`` (at any
+    depth) to the related name that can be used to reach them from ``model`` in
+    queries.
+
+    Each subclass's own mapping is cached and reused here with a prefix added,
+    so every part of the class hierarchy is only explored once. A read-only
+    view is returned so that callers can't modify the cached value.
+    """
+    values = {}
+    legacy_page_models = get_legacy_page_models()
+    for rel in model._meta.related_objects:
+        if (
+            isinstance(rel, OneToOneRel)
+            and rel.related_model in legacy_page_models
+            and issubclass(rel.related_model, model)
+        ):
+            values[rel.related_model] = rel.name
+            for subclass, related_name in get_concrete_subclass_related_names(
+                rel.related_model
+            ).items():
+                values[subclass] = f"{rel.name}__{related_name}"
+    return MappingProxyType(values)
 
 
 @functools.lru_cache(maxsize=None)
-def get_concrete_local_field_names(model: Type) -> Set[str]:
-    return set(
+def get_concrete_local_field_names(model: Type) -> FrozenSet[str]:
+    return frozenset(
         f.name
         for f in model._meta.get_fields(include_parents=False, include_hidden=False)
     )
 
 
+@functools.lru_cache(maxsize=None)
+def get_field_names(model: Type) -> FrozenSet[str]:
+    """
+    Return the names of all fields that ``_meta.get_field()`` would find on
+    ``model`` (including inherited ones), for cheap existence checks.
+    """
+    names = set()
+    for f in model._meta.get_fields(include_hidden=True):
+        names.add(f.name)
+        if getattr(f, "attname", None):
+            names.add(f.attname)
+    return frozenset(names)
+
+
+@functools.lru_cache(maxsize=None)
+def get_subclass_field_lookups(model: Type) -> Mapping[str, Tuple[str, ...]]:
+    """
+    Return a mapping of field names to the lookup paths (relative to ``model``)
+    of every concrete subclass of ``model`` that defines a field with that name.
+    """
+    lookups = {}
+    for _, related_name, local_field_names, _ in get_subclass_plan(model):
+        for field_name in local_field_names:
+            lookups.setdefault(field_name, []).append(f"{related_name}__{field_name}")
+    return MappingProxyType({name: tuple(paths) for name, paths in lookups.items()})
+
+
+@functools.lru_cache(maxsize=None)
+def get_legacy_id_field(model: Type) -> Optional[str]:
+    return getattr(model, "LEGACY_ID_FIELD", None)
+
+
+@functools.lru_cache(maxsize=None)
+def get_subclass_plan(
+    model: Type,
+) -> Tuple[Tuple[Type, str, FrozenSet[str], Optional[str]], ...]:
+    """
+    Return a ``(subclass, related_name, local_field_names, legacy_id_field)``
+    tuple for every concrete subclass of ``model``, so that the query helpers
+    below can get everything they need about subclasses in a single pass.
+    """
+    return tuple(
+        (
+            subclass,
+            related_name,
+            get_concrete_local_field_names(subclass),
+            get_legacy_id_field(subclass),
+        )
+        for subclass, related_name in get_concrete_subclass_related_names(model).items()
+    )
+
+
 def get_legacy_page_field_values(
-    field_name: str, queryset: PageQuerySet = None, exclude_nulls=False
-) -> Tuple[Any]:
-    if queryset is None:
-        queryset = Page.objects.all()
-
-    coalesce_keys = []
-    for model, related_name in get_concrete_subclass_related_names(
-        queryset.model
-    ).items():
-        try:
-            model._meta.get_field(field_name)
-            coalesce_keys.append(f"{related_name}__{field_name}")
-        except FieldDoesNotExist:
-            pass
+    field_name: str, queryset: PageQuerySet = None, exclude_nulls=False, distinct=False
+) -> Union[Tuple[Any], FrozenSet[Any]]:
+    """
+    Return the values of ``field_name`` for pages in ``queryset``, wherever in
+    the page type hierarchy the field is defined.
 
+    Values are returned as a tuple, or as a frozenset if ``distinct`` is
+    ``True``, in which case duplicates are removed by the database.
+    """
+    empty_result = frozenset() if distinct else ()
+
+    # Return early if no subclass defines the field
+    model = Page if queryset is None else queryset.model
+    coalesce_keys = get_subclass_field_lookups(model).get(field_name)
     if not coalesce_keys:
-        return ()
+        return empty_result
+
+    if queryset is None and exclude_nulls:
+        # Every page's value lives in exactly one subclass table, so the non-null
+        # values can be read from those tables directly (with UNION ALL), without
+        # joining them all onto the page table
+        subclass_querysets = [
+            model._base_manager.filter(**{f"{field_name}__isnull": False})
+            .order_by()
+            .values_list(field_name, flat=True)
+            for model, _, local_field_names, _ in get_subclass_plan(Page)
+            if field_name in local_field_names
+        ]
+        values = subclass_querysets[0]
+        if len(subclass_querysets) > 1:
+            values = values.union(*subclass_querysets[1:], all=not distinct)
+        elif distinct:
+            values = values.distinct()
+    else:
+        if queryset is None:
+            # filter() and annotate() below create the queryset
+            queryset = Page.objects
 
-    queryset = queryset.annotate(**{field_name: Coalesce(*coalesce_keys)})
-    if exclude_nulls:
-        queryset = queryset.exclude(**{f"{field_name}__isnull": True})
-    return tuple(queryset.values_list(field_name, flat=True))
+        if exclude_nulls:
+            # Filter on the subclass columns directly (rather than on the annotated
+            # value) so that the database can apply the condition to each join
+            queryset = queryset.filter(
+                Q(
+                    *((f"{key}__isnull", False) for key in coalesce_keys),
+                    _connector=Q.OR,
+                )
+            )
+        if len(coalesce_keys) > 1:
+            value_expression = Coalesce(*coalesce_keys)
+        else:
+            # Coalesce() requires at least two expressions
+            value_expression = F(coalesce_keys[0])
+        queryset = queryset.annotate(**{field_name: value_expression})
+        values = queryset.values_list(field_name, flat=True)
+        if distinct:
+            # Clear any default ordering, which would otherwise be added to the
+            # SELECT DISTINCT columns
+            values = values.order_by().distinct()
+
+    # Use iterator() to avoid populating the queryset's result cache, which would
+    # hold a second copy of every value in memory
+    if distinct:
+        return frozenset(values.iterator(chunk_size=2000))
+    return tuple(values.iterator(chunk_size=2000))
+
+
+@functools.lru_cache(maxsize=None)
+def get_legacy_page_match_lookups(
+    model: Type, field_names: Tuple[str, ...], lookup_type: str
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[Type, Tuple[str, ...]], ...]]:
+    """
+    Return the lookups that ``get_legacy_page_matches()`` needs to match the
+    named fields for ``model``, as a ``(lookups, subclass_lookups)`` tuple.
+    ``lookups`` apply to ``model`` itself, and ``subclass_lookups`` pairs each
+    concrete subclass that defines one of the fields with lookups for its own
+    table. Only the value being matched changes between calls, so everything
+    else is worked out once.
+    """
+    lookups = []
+    model_field_names = get_field_names(model)
+    legacy_id_field = get_legacy_id_field(model)
+    for name in field_names:
+        if name == "legacy_id" and legacy_id_field:
+            lookups.append(f"{legacy_id_field}__{lookup_type}")
+        elif name in model_field_names:
+            lookups.append(f"{name}__{lookup_type}")
+
+    # Skip the subclass loop entirely if no subclass defines any of the fields
+    # ('legacy_id' can map to a different field name for each subclass)
+    subclass_field_lookups = get_subclass_field_lookups(model)
+    if "legacy_id" not in field_names and not any(
+        name in subclass_field_lookups for name in field_names
+    ):
+        return tuple(lookups), ()
+
+    subclass_lookups = []
+    for subclass, _, local_field_names, subclass_legacy_id_field in get_subclass_plan(
+        model
+    ):
+        local_lookups = []
+        for name in field_names:
+            if name == "legacy_id" and subclass_legacy_id_field:
+                lookup_field = subclass_legacy_id_field
+            else:
+                lookup_field = name
+            if lookup_field in local_field_names:
+                local_lookups.append(f"{lookup_field}__{lookup_type}")
+        if local_lookups:
+            subclass_lookups.append((subclass, tuple(local_lookups)))
+    return tuple(lookups), tuple(subclass_lookups)
 
 
 def get_legacy_page_matches(
     value: Any, *field_names: str, queryset: PageQuerySet = None, lookup_type=None
 ):
+    return get_legacy_page_matches_for_values(
+        (value,), *field_names, queryset=queryset, lookup_type=lookup_type
+    )
+
+
+def get_legacy_page_matches_for_values(
+    values: Sequence[Any],
+    *field_names: str,
+    queryset: PageQuerySet = None,
+    lookup_type=None,
+):
+    """
+    Like ``get_legacy_page_matches()``, but matches pages where any of the
+    named fields match any of ``values``, using a single filter.
+    """
     if lookup_type is None:
         lookup_type = "exact"
-    q = Q()
 
+    # Without a queryset, use the manager directly, which saves creating a
+    # Page.objects.all() queryset only to clone it again via none() or filter()
     if queryset is None:
-        queryset = Page.objects.all()
+        queryset = Page.objects
 
-    for name in field_names:
-        if name == "legacy_id" and getattr(queryset.model, "LEGACY_ID_FIELD", None):
-            q |= Q(**{f"{queryset.model.LEGACY_ID_FIELD}__{lookup_type}": value})
-        else:
-            try:
-                queryset.model._meta.get_field(name)
-            except FieldDoesNotExist:
-                pass
-            else:
-                q |= Q(**{f"{name}__{lookup_type}": value})
+    if not field_names or not values:
+        return queryset.none()
 
-    for model, related_name in get_concrete_subclass_related_names(
-        queryset.model
-    ).items():
-        model_field_names = get_concrete_local_field_names(model)
-        for name in field_names:
-            if name == "legacy_id" and getattr(model, "LEGACY_ID_FIELD", None):
-                lookup_field = model.LEGACY_ID_FIELD
-            else:
-                lookup_field = name
-            if lookup_field in model_field_names:
-                q |= Q(**{f"{related_name}__{lookup_field}__{lookup_type}": value})
+    lookups, subclass_lookups = get_legacy_page_match_lookups(
+        queryset.model, field_names, lookup_type
+    )
+    q = Q(
+        *((lookup, value) for lookup in lookups for value in values),
+        _connector=Q.OR,
+    )
+
+    # Match subclass fields with a 'pk IN (...)' subquery that UNIONs a narrow
+    # select from each subclass table, rather than joining every subclass table
+    # onto the root table, so that each branch only touches the table that holds
+    # the field (and can use its indexes)
+    pk_querysets = [
+        model._base_manager.filter(
+            Q(
+                *((lookup, value) for lookup in model_lookups for value in values),
+                _connector=Q.OR,
+            )
+        )
+        .order_by()
+        .values("pk")
+        for model, model_lookups in subclass_lookups
+    ]
+    if pk_querysets:
+        pks = pk_querysets[0]
+        if len(pk_querysets) > 1:
+            pks = pks.union(*pk_querysets[1:])
+        q |= Q(pk__in=pks)
 
     if not q:
         return queryset.none()
     return queryset.filter(q)
 
 
+@functools.lru_cache(maxsize=4096)
+def get_legacy_path_variants(value: str) -> Tuple[str, ...]:
+    """
+    Return the distinct forms of the path ``value`` with and without leading
+    and trailing slashes. The same legacy paths tend to be looked up many
+    times during an import.
+    """
+    path = value.strip("/ ")
+    return tuple(dict.fromkeys((path, f"/{path}", f"{path}/", f"/{path}/")))
+
+
 def get_legacy_path_matches(value: str, queryset: PageQuerySet = None, exact=True):
     if exact:
-        lookup_val = value
-        lookup_type = "exact"
-    else:
-        lookup_val = r"^/?" + re.escape(value.strip("/ ")) + r"/?$"
-        lookup_type = "iregex"
+        return get_legacy_page_matches(value, "legacy_path", queryset=queryset)
 
-    return get_legacy_page_matches(
-        lookup_val, "legacy_path", queryset=queryset, lookup_type=lookup_type
+    # Comparing against each variant with 'iexact' finds the same pages as a
+    # '^/?<path>/?$' 'iregex' lookup, without the database having to evaluate
+    # a regular expression for every row
+    return get_legacy_page_matches_for_values(
+        get_legacy_path_variants(value),
+        "legacy_path",
+        queryset=queryset,
+        lookup_type="iexact",
     )
 
 
@@ -0,0 +1,106 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from .io import PrefetchedFiles, fetch_file, filename_from_url, get_session
+
+URL = "https://example.com/files/report.pdf"
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def test_get_session_reused_within_thread():
+    assert get_session() is get_session()
+    assert get_session(3) is get_session(3)
+
+
+def test_get_session_per_max_retries():
+    session = get_session(3)
+    assert session is not get_session(0)
+    assert session.get_adapter("https://example.com").max_retries.total == 3
+    assert session.get_adapter("http://example.com").max_retries.total == 3
+
+
+def test_get_session_not_shared_between_threads():
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(get_session(3)))
+    thread.start()
+    thread.join()
+    assert sessions[0] is not get_session(3)
+
+
+def test_fetch_file_passes_max_retries(mocker):
+    get_session = mocker.patch("importo.utils.io.get_session")
+    response = get_session.return_value.get.return_value
+    response.content = b"content"
+
+    file = fetch_file("https://example.com/file.pdf", max_retries=5)
+
+    get_session.assert_called_once_with(5)
+    get_session.return_value.get.assert_called_once_with(
+        "https://example.com/file.pdf", verify=False, stream=False
+    )
+    response.raise_for_status.assert_called_once_with()
+    assert file.getvalue() == b"content"
+    assert file.hash == "040f06fd774092478d450774f5ba30c5da78acc8"
+
+
+def test_prefetched_file_handed_to_calling_thread(mocker, executor):
+    fetch_threads = []
+
+    def fake_fetch_file(url, add_hash=True, max_retries=0):
+        fetch_threads.append(threading.current_thread())
+        return io.BytesIO(b"content")
+
+    mocker.patch("importo.utils.io.fetch_file", side_effect=fake_fetch_file)
+    files = PrefetchedFiles()
+    files.prefetch([URL, URL], executor)
+
+    assert files.fetch(URL).getvalue() == b"content"
+    assert len(fetch_threads) == 1
+    assert fetch_threads[0] is not threading.current_thread()
+
+    # Prefetched downloads are only used once
+    assert files.fetch(URL).getvalue() == b"content"
+    assert len(fetch_threads) == 2
+    assert fetch_threads[1] is threading.current_thread()
+
+
+def test_prefetch_passes_max_retries(mocker, executor):
+    fetch_file = mocker.patch("importo.utils.io.fetch_file")
+    files = PrefetchedFiles()
+    files.prefetch([URL], executor, add_hash=False, max_retries=5)
+    files.fetch(URL)
+    fetch_file.assert_called_once_with(URL, add_hash=False, max_retries=5)
+
+
+def test_prefetch_errors_raised_by_fetch(mocker, executor):
+    mocker.patch("importo.utils.io.fetch_file", side_effect=OSError("Timed out"))
+    files = PrefetchedFiles()
+    files.prefetch([URL], executor)
+    with pytest.raises(OSError, match="Timed out"):
+        files.fetch(URL)
+
+
+def test_prefetched_files_clear(mocker, executor):
+    fetch_file = mocker.patch("importo.utils.io.fetch_file")
+    files = PrefetchedFiles()
+    files.prefetch([URL], executor)
+    files.clear()
+    executor.shutdown(wait=True)
+    fetch_file.reset_mock()
+    files.fetch(URL, max_retries=3)
+    fetch_file.assert_called_once_with(URL, add_hash=True, max_retries=3)
+
+
+def test_filename_from_url():
+    assert (
+        filename_from_url("https://example.com/my%20file.jpg?token=here")
+        == "my file.jpg"
+    )
@@ -0,0 +1,192 @@
+import re
+
+import pytest
+from wagtail.models import Page
+
+from importo.testapp.models import (
+    LegacyArticlePage,
+    LegacyEventPage,
+    LegacyPage,
+    StandardPage,
+)
+
+from . import query
+
+CACHED_FUNCTIONS = (
+    query.get_legacy_page_models,
+    query.get_concrete_subclass_related_names,
+    query.get_concrete_local_field_names,
+    query.get_field_names,
+    query.get_subclass_field_lookups,
+    query.get_legacy_id_field,
+    query.get_subclass_plan,
+    query.get_legacy_page_match_lookups,
+    query.get_legacy_path_variants,
+)
+
+
+@pytest.fixture(autouse=True)
+def legacy_page_models(mocker):
+    for func in CACHED_FUNCTIONS:
+        func.cache_clear()
+    mocker.patch.object(
+        query,
+        "get_legacy_page_models",
+        return_value=frozenset({LegacyPage, LegacyEventPage, LegacyArticlePage}),
+    )
+    yield
+    for func in CACHED_FUNCTIONS:
+        func.cache_clear()
+
+
+@pytest.fixture
+def pages(db):
+    root = Page.get_first_root_node()
+    pages = {}
+    for key, page in (
+        ("about", LegacyPage(legacy_id=1, legacy_path="/about/")),
+        ("about_us", LegacyPage(legacy_id=2, legacy_path="About-Us")),
+        ("talk", LegacyEventPage(legacy_id=3, legacy_path="/events/talk")),
+        ("news", LegacyArticlePage(legacy_nid=4, legacy_path="news/")),
+        ("news_copy", LegacyPage(legacy_id=5, legacy_path="news/")),
+        ("article", LegacyArticlePage()),
+        ("legacy", LegacyPage()),
+        ("standard", StandardPage()),
+    ):
+        page.title = page.slug = key.replace("_", "-")
+        pages[key] = root.add_child(instance=page)
+    return pages
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["about", "/about/", "ABOUT/", "about-us", "/events/talk/", "/News", "missing"],
+)
+def test_get_legacy_path_matches_inexact(pages, value, django_assert_num_queries):
+    # Legacy paths used to be matched with a single 'iregex' lookup
+    regex_matches = query.get_legacy_page_matches(
+        r"^/?" + re.escape(value.strip("/ ")) + r"/?$",
+        "legacy_path",
+        lookup_type="iregex",
+    )
+    expected = set(regex_matches.values_list("pk", flat=True))
+
+    matches = query.get_legacy_path_matches(value, exact=False)
+    # Every variant is compared in one filter, with one subquery per subclass table
+    assert str(matches.query).count("UNION") == 1
+    with django_assert_num_queries(1):
+        assert set(matches.values_list("pk", flat=True)) == expected
+
+
+def test_get_legacy_path_matches_inexact_results(pages):
+    def match_pks(value, **kwargs):
+        return set(
+            query.get_legacy_path_matches(value, exact=False, **kwargs).values_list(
+                "pk", flat=True
+            )
+        )
+
+    assert match_pks("about") == {pages["about"].pk}
+    assert match_pks("/events/talk/") == {pages["talk"].pk}
+    assert match_pks("NEWS") == {pages["news"].pk, pages["news_copy"].pk}
+    assert match_pks("news", queryset=LegacyPage.objects.all()) == {
+        pages["news_copy"].pk
+    }
+    assert match_pks("news", queryset=LegacyArticlePage.objects.all()) == {
+        pages["news"].pk
+    }
+    assert match_pks("missing") == set()
+
+
+LEGACY_PATHS = ("/about/", "About-Us", "/events/talk", "news/", "news/")
+
+
+@pytest.mark.parametrize("queryset", [None, Page.objects.all()])
+def test_get_legacy_page_field_values_exclude_nulls(pages, queryset):
+    values = query.get_legacy_page_field_values(
+        "legacy_path", queryset=queryset, exclude_nulls=True
+    )
+    assert isinstance(values, tuple)
+    assert sorted(values) == sorted(LEGACY_PATHS)
+
+    values = query.get_legacy_page_field_values(
+        "legacy_path", queryset=queryset, exclude_nulls=True, distinct=True
+    )
+    assert values == frozenset(LEGACY_PATHS)
+
+
+@pytest.mark.parametrize("queryset", [None, Page.objects.all()])
+def test_get_legacy_page_field_values_include_nulls(pages, queryset):
+    # Pages without a value (including those of types without the field)
+    # contribute None
+    null_count = Page.objects.count() - len(LEGACY_PATHS)
+    values = query.get_legacy_page_field_values("legacy_path", queryset=queryset)
+    assert sorted(values, key=str) == sorted(
+        LEGACY_PATHS + (None,) * null_count, key=str
+    )
+
+    values = query.get_legacy_page_field_values(
+        "legacy_path", queryset=queryset, distinct=True
+    )
+    assert values == frozenset(LEGACY_PATHS + (None,))
+
+
+def test_get_legacy_page_field_values_filtered_queryset(pages):
+    queryset = Page.objects.filter(
+        pk__in=[pages[key].pk for key in ("about", "talk", "article", "standard")]
+    )
+    values = query.get_legacy_page_field_values("legacy_path", queryset=queryset)
+    assert sorted(values, key=str) == sorted(
+        ("/about/", "/events/talk", None, None), key=str
+    )
+    values = query.get_legacy_page_field_values(
+        "legacy_path", queryset=queryset, exclude_nulls=True, distinct=True
+    )
+    assert values == frozenset({"/about/", "/events/talk"})
+
+
+def test_get_legacy_page_field_values_subclass_queryset(pages):
+    LegacyEventPage.objects.filter(pk=pages["talk"].pk).update(venue="Tate Modern")
+    queryset = LegacyPage.objects.all()
+    values = query.get_legacy_page_field_values("venue", queryset=queryset)
+    assert sorted(values, key=str) == sorted(
+        ("Tate Modern", None, None, None, None), key=str
+    )
+    values = query.get_legacy_page_field_values(
+        "venue", queryset=queryset, exclude_nulls=True, distinct=True
+    )
+    assert values == frozenset({"Tate Modern"})
+
+
+@pytest.mark.parametrize("distinct, empty_result", [(False, ()), (True, frozenset())])
+def test_get_legacy_page_field_values_undefined_field(
+    pages, distinct, empty_result, django_assert_num_queries
+):
+    # No page type defines the field, so the database isn't queried
+    with django_assert_num_queries(0):
+        assert (
+            query.get_legacy_page_field_values("body", distinct=distinct)
+            == empty_result
+        )
+        assert (
+            query.get_legacy_page_field_values(
+                "legacy_path",
+                queryset=StandardPage.objects.all(),
+                exclude_nulls=True,
+                distinct=distinct,
+            )
+            == empty_result
+        )
+
+
+def test_get_legacy_page_field_values_field_on_some_subclasses(pages):
+    assert sorted(
+        query.get_legacy_page_field_values("legacy_id", exclude_nulls=True)
+    ) == [1, 2, 3, 5]
+    assert query.get_legacy_page_field_values(
+        "legacy_nid", exclude_nulls=True, distinct=True
+    ) == frozenset({4})
+    values = query.get_legacy_page_field_values("legacy_nid")
+    assert sorted(values, key=str) == sorted(
+        (4,) + (None,) * (Page.objects.count() - 1), key=str
+    )
@@ -0,0 +1,70 @@
+from urllib.parse import urlsplit
+
+import pytest
+
+from . import uri
+from .uri import is_internal_uri
+
+
+@pytest.fixture(autouse=True)
+def internal_hosts(mocker):
+    mocker.patch.object(
+        uri, "INTERNAL_CONTENT_HOSTS", frozenset({"https://www.example.com"})
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "/path/slug.html",
+        "/path/slug/",
+        "/path/slug",
+        "path/slug.html",
+        "page/slug/",
+        "/path/slug?query=value#fragment",
+    ],
+)
+def test_relative_paths_are_internal(value, mocker):
+    spy = mocker.spy(uri, "urlsplit")
+    assert is_internal_uri(value)
+    # No parsing is needed for values without a scheme or hostname
+    spy.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("//www.example.com/path/slug", False),
+        ("//www.other.com/path/slug", False),
+        ("/path//slug", True),
+    ],
+)
+def test_values_containing_double_slashes(value, expected):
+    assert is_internal_uri(value) is expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("https://www.example.com/path/slug", True),
+        ("http://www.example.com/path/slug", False),
+        ("https://www.other.com/path/slug", False),
+        ("mailto:info@example.com", False),
+        ("tel:+441234567890", False),
+        ("path/slug:2", True),
+    ],
+)
+def test_values_containing_colons(value, expected):
+    assert is_internal_uri(value) is expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("/path/slug", True),
+        ("https://www.example.com/path/slug", True),
+        ("https://www.other.com/path/slug", False),
+    ],
+)
+def test_parsed_values(value, expected):
+    assert is_internal_uri(urlsplit(value)) is expected
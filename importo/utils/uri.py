@@ -25,8 +25,10 @@ def extract_slug(path_or_uri: str) -> str:
     raise ValueError(f"Slug could not be extracted from '{path_or_uri}'.")
 
 
-INTERNAL_CONTENT_HOSTS = set(getattr(settings, "IMPORTO_INTERNAL_CONTENT_HOSTS", ()))
-INTERNAL_MEDIA_HOSTS = set(getattr(settings, "IMPORTO_INTERNAL_MEDIA_HOSTS", ()))
+INTERNAL_CONTENT_HOSTS = frozenset(
+    getattr(settings, "IMPORTO_INTERNAL_CONTENT_HOSTS", ())
+)
+INTERNAL_MEDIA_HOSTS = frozenset(getattr(settings, "IMPORTO_INTERNAL_MEDIA_HOSTS", ()))
 
 
 def normalize_path(path: str) -> str:
@@ -49,6 +51,10 @@ def is_internal_uri(value: Union[str, ParseResult]) -> bool:
     """
     if isinstance(value, (ParseResult, SplitResult)):
         parsed = value
+    elif ":" not in value and "//" not in value:
+        # Without either of these, there can be no scheme or hostname to
+        # check, so this must be a relative URL
+        return True
     else:
         parsed = urlsplit(value)
 
@@ -558,8 +558,8 @@ class BaseContentFixupCommand(
     def clean_richtext(self, value) -> str:
         if self.remove_only or not value or "<a " not in value:
             return value
-        parser = RichTextParser(command=self)
-        new_value = parser.parse(value, link_replacement_only=True)
+        with RichTextParser(command=self) as parser:
+            new_value = parser.parse(value, link_replacement_only=True)
         for error in parser.link_match_errors:
             self.log_fixup_error(error.msg, error.exception)
         return new_value
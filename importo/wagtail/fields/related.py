@@ -131,7 +131,7 @@ class ImageReferenceField(BaseFinderField):
                 raise error_to_reraise from e
 
             # Add to the finder cache for faster repeat lookups
-            self.finder.add_to_cache(obj, file_path)
+            self.finder.add_to_cache(file_path, obj)
             return obj
 
         return super().handle_not_found(value)
@@ -27,7 +27,7 @@ class FootnotesParser(BaseRichTextContainingParser):
         for item in soup.select("li.footnote"):
             # Use same method as RichtextParser.update_footnote_links()
             # to turn the 6-digit value from Drupal to a full UUID
-            id = uuid.uuid3(uuid.NAMESPACE_DNS, item["id"].split("_").pop())
+            id = uuid.uuid3(uuid.NAMESPACE_DNS, item["id"].rpartition("_")[2])
             contents = "".join(str(c) for c in item.contents)
             footnotes.append(
                 Footnote(
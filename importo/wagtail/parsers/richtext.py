@@ -1,11 +1,16 @@
 import uuid
+from typing import Iterable, List
 from urllib.parse import urlparse
 
 import bs4
 from django.core.exceptions import ObjectDoesNotExist
-from tate.utils.html import tidy_html
 
-from .base import BaseParser
+from importo.parsers.base import BaseParser
+from importo.utils.html import tidy_html
+from importo.utils.uri import is_external_uri
+
+# Links starting with any of these can never be matched to a page or document
+UNMATCHABLE_LINK_PREFIXES = ("#", "?", "mailto:", "tel:", "javascript:")
 
 
 class LinkMatchError:
@@ -34,7 +39,9 @@ class RichTextParser(BaseParser):
     - page_finder (property)
     - find_image(value)
     - find_document(value)
+    - find_document_pk(value)
     - find_page(value)
+    - find_page_pk(value)
     """
 
     tags_replace = {
@@ -70,58 +77,113 @@ class RichTextParser(BaseParser):
         if not value:
             return ""
         self.soup = self.get_soup(value)
-        if not link_replacement_only:
-            self.replace_tags()
-            self.remove_unwanted_html()
-            self.update_footnote_links()
-        self.update_internal_links()
+        link_tags = self._fuse_passes(link_replacement_only)
+        self.update_internal_links(link_tags)
         return tidy_html(str(self.soup))
 
-    def replace_tags(self, tag=None):
+    def _fuse_passes(self, link_replacement_only=False) -> List[bs4.Tag]:
+        """
+        Walk the tree once, applying tag replacement, HTML cleanup and footnote
+        link conversion to each tag as it is encountered (unless
+        ``link_replacement_only`` is ``True``). Returns a list of the remaining
+        ``<a>`` tags with ``href`` values, so that they can be passed to
+        ``update_internal_links()``.
+        """
+        link_tags = []
+        # NOTE: find_all() returns a list, so it's safe to modify the tree here
+        for tag in self.soup.find_all(True):
+            if not link_replacement_only:
+                self.replace_tag(tag)
+                if not self.clean_tag(tag):
+                    continue
+            if tag.name == "a" and tag.get("href"):
+                if not link_replacement_only and tag["href"].startswith("#footnote"):
+                    self.update_footnote_link(tag)
+                else:
+                    link_tags.append(tag)
+        return link_tags
+
+    def _get_tags(self, tag=None) -> List[bs4.Tag]:
+        """
+        Return a list of ``tag`` and all of its descendant tags. ``tag`` can also
+        be a list of tags, or ``None`` to return all tags in ``self.soup``.
+        """
         if tag is None:
             tag = self.soup
-
         if isinstance(tag, list):
-            for item in tag:
-                self.replace_tags(item)
-            return
+            return [t for item in tag for t in self._get_tags(item)]
+        if not isinstance(tag, bs4.Tag):
+            return []
+        tags = tag.find_all(True)
+        if not isinstance(tag, bs4.BeautifulSoup):
+            tags.insert(0, tag)
+        return tags
 
-        if getattr(tag, "name", None) in self.tags_replace:
-            tag.name == self.tags_replace[tag.name]
+    def replace_tags(self, tag=None) -> None:
+        """
+        Apply ``tags_replace`` to ``tag`` and its descendants (or the whole of
+        ``self.soup`` if ``tag`` is ``None``). ``parse()`` already does this as
+        part of ``_fuse_passes()``.
+        """
+        for item in self._get_tags(tag):
+            self.replace_tag(item)
 
-    def remove_unwanted_html(self, tag=None):
-        if tag is None:
-            tag = self.soup
+    def replace_tag(self, tag: bs4.Tag) -> None:
+        if tag.name in self.tags_replace:
+            tag.name = self.tags_replace[tag.name]
 
-        if not isinstance(tag, bs4.BeautifulSoup) and getattr(tag, "name", None):
-            if tag.name not in self.allowed_tags:
-                tag.unwrap()
-            else:
-                allowed_attrs = self.allowed_attributes.get(tag.name) or ()
-                for key in tuple(tag.attrs.keys()):
-                    if key not in allowed_attrs:
-                        del tag.attrs[key]
+    def remove_unwanted_html(self, tag=None) -> None:
+        """
+        Apply ``clean_tag()`` to ``tag`` and its descendants (or the whole of
+        ``self.soup`` if ``tag`` is ``None``). ``parse()`` already does this as
+        part of ``_fuse_passes()``.
 
-        if hasattr(tag, "contents"):
-            for child in tag.contents:
-                self.remove_unwanted_html(child)
+        Disallowed tags are unwrapped at any depth (including those nested
+        inside other disallowed tags), and disallowed attributes are removed
+        from every tag that remains.
+        """
+        for item in self._get_tags(tag):
+            self.clean_tag(item)
+
+    def clean_tag(self, tag: bs4.Tag) -> bool:
+        """
+        Unwrap ``tag`` if it isn't allowed, or remove any attributes that are not
+        allowed for it. Returns a boolean indicating whether the tag was kept.
+        """
+        if tag.name not in self.allowed_tags:
+            tag.unwrap()
+            return False
+        allowed_attrs = self.allowed_attributes.get(tag.name) or ()
+        for key in tuple(tag.attrs.keys()):
+            if key not in allowed_attrs:
+                del tag.attrs[key]
+        return True
 
     def update_footnote_links(self) -> None:
         """
-        Turn footnote links into ``<footnote>`` elements, with an ``id``
+        Apply ``update_footnote_link()`` to all footnote links in ``self.soup``.
+        ``parse()`` already does this as part of ``_fuse_passes()``.
+        """
+        for tag in self.soup.select('a[href^="#footnote"]'):
+            self.update_footnote_link(tag)
+
+    def update_footnote_link(self, tag: bs4.Tag) -> None:
+        """
+        Turn a footnote link into a ``<footnote>`` element, with an ``id``
         attribute value matching the UUID of the relevant ``Footnote``
         from ``self.footnotes_data``.
         """
-        for tag in self.soup.select('a[href^="#footnote"]'):
-            # Use same method as FootnoteParser.parse() to turn
-            # the 6-digit value from Drupal to a full UUID
-            id = uuid.uuid3(uuid.NAMESPACE_DNS, tag["href"].split("_").pop())
-            footnote = self.soup.new_tag("footnote", id=id)
-            footnote.string = f"[{str(id)[:6]}]"
-            tag.replace_with(footnote)
-
-    def update_internal_links(self) -> None:
-        for tag in self.soup.find_all("a", href=True):
+        # Use same method as FootnoteParser.parse() to turn
+        # the 6-digit value from Drupal to a full UUID
+        id = uuid.uuid3(uuid.NAMESPACE_DNS, tag["href"].rpartition("_")[2])
+        footnote = self.soup.new_tag("footnote", id=id)
+        footnote.string = f"[{str(id)[:6]}]"
+        tag.replace_with(footnote)
+
+    def update_internal_links(self, tags: Iterable[bs4.Tag] = None) -> None:
+        if tags is None:
+            tags = self.soup.find_all("a", href=True)
+        for tag in tags:
             """
             For links that look like Document links
             1.  Add a ``linktype`` attribute with the value ``"document"``.
@@ -141,6 +203,12 @@ class RichTextParser(BaseParser):
                 tag["href"] = f"http:/{url}"
                 continue
 
+            # Avoid parsing URLs that could not possibly match. Like links to
+            # external domains (below), these are left alone without adding
+            # anything to 'link_match_errors', because no match is expected
+            if url.startswith(UNMATCHABLE_LINK_PREFIXES):
+                continue
+
             try:
                 parse_result = urlparse(url)
             except ValueError as e:
@@ -153,10 +221,14 @@ class RichTextParser(BaseParser):
                 self.log_debug(f"Leaving richtext link with fragment alone: '{url}'.")
                 continue
 
+            # Avoid finder lookups for domains we are not interested in
+            if parse_result.scheme and is_external_uri(parse_result):
+                continue
+
             if self.document_finder.looks_like_document_url(parse_result):
                 self.log_debug(f"Looking for document '{url}'.")
                 try:
-                    document = self.find_document(parse_result.path)
+                    document_pk = self.find_document_pk(parse_result.path)
                 except ObjectDoesNotExist as e:
                     msg = "Failed to update richtext link"
                     self.link_match_errors.append(LinkMatchError(msg, e))
@@ -164,14 +236,14 @@ class RichTextParser(BaseParser):
                 else:
                     self.log_debug("Richtext link updated successfully")
                     tag["linktype"] = "document"
-                    tag["id"] = document.pk
+                    tag["id"] = document_pk
                     del tag["href"]
                 continue  # Avoid trying to match URL to a page
 
             if self.page_finder.looks_like_page_url(parse_result):
                 self.log_debug(f"Looking for page '{url}'.")
                 try:
-                    page = self.find_page(url)
+                    page_pk = self.find_page_pk(url)
                 except ObjectDoesNotExist as e:
                     msg = "Failed to update richtext link"
                     self.link_match_errors.append(LinkMatchError(msg, e))
@@ -179,6 +251,6 @@ class RichTextParser(BaseParser):
                 else:
                     self.log_debug("Richtext link updated successfully")
                     tag["linktype"] = "page"
-                    tag["id"] = page.pk
+                    tag["id"] = page_pk
                     del tag["href"]
                 continue
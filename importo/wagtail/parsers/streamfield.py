@@ -1,10 +1,24 @@
+import functools
 import re
 import uuid
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
-from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import ParseResult, urlparse
 
 from bs4.element import NavigableString, Tag
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 from tate.core.blocks.banners import (
     BannerHeightChoices,
@@ -25,9 +39,10 @@ from tate.core.constants import (
 from tate.events.models import EventVenuePage
 from wagtail.images import get_image_model
 
-from .base import BaseRichTextContainingParser
+from importo.parsers.base import BaseRichTextContainingParser
+from importo.wagtail.utils import dump
+
 from .richtext import RichTextParser
-from .utils import dump
 
 if TYPE_CHECKING:
     from tate.art.archives.models import ArchiveItemPage, ArchivePage
@@ -35,6 +50,8 @@ if TYPE_CHECKING:
     from tate.art.artworks.models import ArtworkPage
     from tate.events.models import EventPage
 
+    from importo.commands import BaseCommand
+
 
 Image = get_image_model()
 
@@ -63,6 +80,10 @@ API_EMBED_TYPE_TO_FIGURE_TYPE = {
     "artwork": "image",
 }
 
+CARD_EMBED_TYPES = frozenset(API_EMBED_TYPE_TO_CARD_TYPE)
+
+FIGURE_EMBED_TYPES = frozenset(API_EMBED_TYPE_TO_FIGURE_TYPE)
+
 COLUMNS_INT_TO_BLOCK_VALUE = {
     1: StripColumnChoices.ONE,
     2: StripColumnChoices.TWO,
@@ -72,9 +93,77 @@ COLUMNS_INT_TO_BLOCK_VALUE = {
     6: StripColumnChoices.SIX,
 }
 
-RICHTEXT_BLOCK_ELEMENT_NAMES = ("ol", "p", "h3", "h4", "h5", "ul")
+BANNER_HEIGHT_INT_TO_BLOCK_VALUE = {
+    33: BannerHeightChoices.THIRD,
+    50: BannerHeightChoices.HALF,
+    60: BannerHeightChoices.SIXTY,
+    70: BannerHeightChoices.SEVENTY,
+    80: BannerHeightChoices.EIGHTY,
+    90: BannerHeightChoices.NINETY,
+}
+
+# Ordered (substring, option name, value) rules for interpreting the classnames
+# of 'strip' and 'strip_banner_v2' sections. For each classname, only the
+# first matching rule is applied.
+STRIP_CLASSNAME_RULES = (
+    ("carousel", "layout", StripLayoutChoices.CAROUSEL),
+    ("masonry", "layout", StripLayoutChoices.MASONRY),
+    ("title-over-image", "layout", StripLayoutChoices.OVER_IMAGE),
+    ("image-canvas", "layout", StripLayoutChoices.CANVAS),
+    ("border", "layout", StripLayoutChoices.CANVAS_BORDER),
+    ("align", "layout", StripLayoutChoices.CENTER_ALIGN),
+    ("cloud", "layout", StripLayoutChoices.ART_TERMS_TAG_CLOUD),
+    ("portrait", "style", StripStyleChoices.PORTRAIT),
+    ("landscape", "style", StripStyleChoices.LANDSCAPE),
+    ("2-col-mobile", "style", StripStyleChoices.PORTRAIT_2_COL_MOBILE),
+    ("thumbnail", "style", StripStyleChoices.THUMBNAIL),
+    ("alternate", "style", StripStyleChoices.ALTERNATE),
+)
+
+BANNER_CLASSNAME_RULES = (
+    ("black__overlay", "text_style", TextStyleChoices.BLACK_TEXT_WITH_OVERLAY),
+    ("white__overlay", "text_style", TextStyleChoices.WHITE_TEXT_WITH_OVERLAY),
+    ("white", "text_style", TextStyleChoices.WHITE_TEXT),
+    ("left", "text_alignment", TextAlignmentChoices.LEFT),
+    ("right", "text_alignment", TextAlignmentChoices.RIGHT),
+)
+
+# Block types that are nested inside 'section' blocks
+SECTION_CONTENT_TYPES = frozenset(["accordion", "page_section"])
+
+RICHTEXT_BLOCK_ELEMENT_NAMES = frozenset(["ol", "p", "h3", "h4", "h5", "ul"])
+
+RICHTEXT_BLOCK_ELEMENT_NAMES_WITH_H2 = RICHTEXT_BLOCK_ELEMENT_NAMES | {"h2"}
+
+RICHTEXT_INLINE_ELEMENT_NAMES = frozenset(["a", "em", "i", "span", "strong", "small"])
+
+SHOP_PRODUCT_ID_REGEX = re.compile(r"([a-z0-9]{4,10})[^-/]+$")
 
-RICHTEXT_INLINE_ELEMENT_NAMES = ("a", "em", "i", "span", "strong", "small")
+
+@functools.lru_cache(maxsize=4096)
+def slugify_cached(value: str) -> str:
+    # The same heading text is often repeated across many pages
+    return slugify(value)
+
+
+def add_paragraph_from_inline_elements(inline_elements: List[str], to: List[str]):
+    if not inline_elements:
+        return
+    to.append(f"<p>{' '.join(inline_elements)}</p>")
+    inline_elements.clear()
+
+
+def add_richtext_block(
+    segments: List[Union[str, Tag]],
+    to: List[Dict[str, Any]],
+    parse_richtext: Callable[[str], str],
+):
+    if not segments:
+        return
+    # Tags are only serialized here, once the whole block is known
+    html = "".join(map(str, segments))
+    to.append({"type": "rich_text", "value": parse_richtext(html)})
+    segments.clear()
 
 
 class StreamFieldContentParser(BaseRichTextContainingParser):
@@ -102,17 +191,30 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
     """
 
     richtext_parse_class = RichTextParser
-    ignore_section_types = []
+    ignore_section_types = frozenset()
+    image_download_workers = 8
+
+    def __init__(self, command: "BaseCommand" = None):
+        super().__init__(command)
+        self._cta_targets = {}
+        self._venue_ids_by_slug = None
 
     def parse(self, value: Sequence[Dict[str, Any]]):
         self.messages = []
         self.value = value
-
-        self.clean_banners()
-        self.clean_strips()
-        self.clean_autostrips()
+        # Results of '_for_block' lookups, keyed by (object type, lookup value).
+        # Failed lookups are stored as the exception raised (for images, the
+        # ValidationError raised when the image could not be downloaded).
+        self._finder_cache = {}
+        # Results of get_cta_target(), keyed by url
+        self._cta_targets = {}
+        # Reloaded on first use, so that venues added between runs are found
+        self._venue_ids_by_slug = None
+
+        self.prefetch_images()
+
+        self.clean_sections()
         self.clean_content_sections()
-        self.clean_article_footers()
         self.clean_custom_blocks()
         self.remove_redundant_sections()
 
@@ -143,6 +245,108 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
             f"Image '{uri}' could not be downloaded for <{block_type} id='{block_id}'>: {error}."
         )
 
+    @staticmethod
+    def get_image_url(file_path: str) -> str:
+        return file_path.replace(
+            "public://", "https://www.tate.org.uk/sites/default/files/"
+        )
+
+    @cached_property
+    def image_field(self):
+        # Shared between prefetch_images() and find_or_download_image_for_block(),
+        # so that the latter can pick up downloads started by the former
+        return self.get_image_field()
+
+    @cached_property
+    def image_download_executor(self) -> ThreadPoolExecutor:
+        # Reused for every parse() call, so that worker threads (and the
+        # HTTP sessions they hold) are only set up once per parser. Shut
+        # down by close().
+        return ThreadPoolExecutor(
+            max_workers=self.image_download_workers,
+            thread_name_prefix="importo-image-download",
+        )
+
+    def close(self) -> None:
+        # Only shut down the executor if prefetch_images() created one
+        executor = self.__dict__.pop("image_download_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        super().close()
+
+    def get_image_field(self):
+        from tate.legacy.constants import SHRINK_IMAGE
+        from tate.legacy.fields import ImageFileField
+
+        return ImageFileField(
+            "+",
+            "file",
+            max_width=4000,
+            max_height=4000,
+            on_max_dimensions_exceeded=SHRINK_IMAGE,
+            command=self.command,
+        )
+
+    def get_image_urls_from_api_data(self, data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield the URLs of any images referenced by an embed/card item, that
+        would be passed to ``find_or_download_image_for_block()`` when
+        converting it.
+        """
+        if data.get("type") == "image" and data.get("uri"):
+            yield self.get_image_url(data["uri"])
+        thumbnail = data.get("thumbnail")
+        if thumbnail and thumbnail.get("type") != "artwork" and thumbnail.get("uri"):
+            yield self.get_image_url(thumbnail["uri"])
+
+    def prefetch_images(self) -> None:
+        """
+        Find or download any images referenced by ``self.value`` up front. Images
+        are matched by ``legacy_path`` in a single query, and any that cannot be
+        found are fetched using a pool of threads to overlap requests. Cleaning,
+        database lookups and saves are left to ``find_or_download_image_for_block()``,
+        which runs in the main thread and picks up the fetched files.
+
+        Downloads are only started if the image field supports ``prefetch()``
+        (project-specific fields might not), otherwise they are left to
+        ``find_or_download_image_for_block()``.
+        """
+        can_prefetch = hasattr(self.image_field, "prefetch")
+        if can_prefetch:
+            self.image_field.clear_prefetched()
+
+        urls = set()
+        for section in self.value:
+            if section["type"] == "strip_banner_v2":
+                if image_uri := section.get("banner_image"):
+                    urls.add(self.get_image_url(image_uri))
+            elif section["type"] in ("strip", "page_section"):
+                for item in section.get("cards") or section.get("embeds") or ():
+                    urls.update(self.get_image_urls_from_api_data(item))
+
+        if not urls:
+            return
+
+        # Match as many images as possible with a single query, and share the
+        # results with the image finder
+        for image in Image.objects.filter(legacy_path__in=urls):
+            self.image_finder.add_to_cache(image.legacy_path, image)
+            self._finder_cache[("Image", image.legacy_path)] = image
+
+        to_download = []
+        for url in urls:
+            if ("Image", url) in self._finder_cache:
+                continue
+            try:
+                self._finder_cache[("Image", url)] = self.find_image(url)
+            except ObjectDoesNotExist:
+                to_download.append(url)
+
+        if not to_download or not can_prefetch:
+            return
+
+        self.image_field.prefetch(to_download, self.image_download_executor)
+
     def find_or_download_image_for_block(
         self,
         file_path: str,
@@ -152,34 +356,35 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
         alt: str = "",
         caption: str = "",
     ) -> Image:
-        from tate.legacy.constants import SHRINK_IMAGE
-        from tate.legacy.fields import ImageFileField
-
-        file_path = file_path.replace(
-            "public://", "https://www.tate.org.uk/sites/default/files/"
-        )
+        file_path = self.get_image_url(file_path)
+        not_found_msg = f"The image '{file_path}' could be found locally OR downloaded."
+
+        cache_key = ("Image", file_path)
+        if cache_key in self._finder_cache:
+            obj = self._finder_cache[cache_key]
+            if isinstance(obj, ValidationError):
+                # The download already failed for an earlier block
+                self.log_image_download_error(file_path, block_type, block_id, obj)
+                raise Image.DoesNotExist(not_found_msg)
+            return obj
 
         try:
             self.log_debug(f"Looking for existing image: '{file_path}'")
-            return self.find_image(file_path)
+            obj = self.find_image(file_path)
         except ObjectDoesNotExist:
             pass
+        else:
+            self._finder_cache[cache_key] = obj
+            return obj
 
-        image_field = ImageFileField(
-            "+",
-            "file",
-            max_width=4000,
-            max_height=4000,
-            on_max_dimensions_exceeded=SHRINK_IMAGE,
-            command=self.command,
-        )
+        image_field = self.image_field
         try:
+            # Picks up the download started by prefetch_images() (if any)
             image_file = image_field.clean(file_path)
         except ValidationError as e:
-            self.log_image_download_error(file_path, e, block_type, block_id)
-            raise Image.DoesNotExist(
-                f"The image '{file_path}' could be found locally OR downloaded."
-            )
+            self.log_image_download_error(file_path, block_type, block_id, e)
+            self._finder_cache[cache_key] = e
+            raise Image.DoesNotExist(not_found_msg)
 
         kwargs = {
             "title": title,
@@ -212,30 +417,69 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
             raise error_to_reraise from e
 
         # Add to the finder cache for faster repeat lookups
-        self.image_finder.add_to_cache(obj, file_path)
+        self.image_finder.add_to_cache(file_path, obj)
+        self._finder_cache[cache_key] = obj
         return obj
 
-    def find_document_for_block(
-        self, lookup_value: Union[int, str], block_type: str, block_id: uuid.UUID
+    def _find_for_block(
+        self,
+        find: Callable[[Any], Any],
+        obj_type: str,
+        lookup_value: Union[int, str],
+        block_type: str,
+        block_id: uuid.UUID,
+        cache_failures: bool = True,
     ):
+        """
+        Return the result of ``find(lookup_value)``, reusing the result of any
+        previous identical lookups made during the current ``parse()`` run.
+        Failed lookups are only reused if ``cache_failures`` is ``True``, and
+        are logged against the block every time.
+        """
         if isinstance(lookup_value, str):
             lookup_value = lookup_value.strip()
+        cache_key = (obj_type, lookup_value)
         try:
-            return self.find_document(lookup_value)
-        except ObjectDoesNotExist:
-            self.log_not_found("Document", lookup_value, block_type, block_id)
-            raise
+            result = self._finder_cache[cache_key]
+        except KeyError:
+            try:
+                result = find(lookup_value)
+            except ObjectDoesNotExist as e:
+                if cache_failures:
+                    self._finder_cache[cache_key] = e
+                self.log_not_found(obj_type, lookup_value, block_type, block_id)
+                raise
+            self._finder_cache[cache_key] = result
+        if isinstance(result, ObjectDoesNotExist):
+            self.log_not_found(obj_type, lookup_value, block_type, block_id)
+            # Re-raise the original exception, without the traceback from
+            # previous raises
+            raise result.with_traceback(None)
+        return result
+
+    def find_document_for_block(
+        self, lookup_value: Union[int, str], block_type: str, block_id: uuid.UUID
+    ):
+        return self._find_for_block(
+            self.find_document,
+            "Document",
+            lookup_value,
+            block_type,
+            block_id,
+            cache_failures=self.document_finder.cache_lookup_failures,
+        )
 
     def find_page_for_block(
         self, lookup_value: Union[int, str], block_type: str, block_id: uuid.UUID
     ):
-        if isinstance(lookup_value, str):
-            lookup_value = lookup_value.strip()
-        try:
-            return self.find_page(lookup_value)
-        except ObjectDoesNotExist:
-            self.log_not_found("Page", lookup_value, block_type, block_id)
-            raise
+        return self._find_for_block(
+            self.find_page,
+            "Page",
+            lookup_value,
+            block_type,
+            block_id,
+            cache_failures=self.page_finder.cache_lookup_failures,
+        )
 
     # Extra Tate-specific finders
 
@@ -245,13 +489,14 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
     def find_artist_for_block(
         self, lookup_value: Union[int, str], block_type: str, block_id: uuid.UUID
     ):
-        if isinstance(lookup_value, str):
-            lookup_value = lookup_value.strip()
-        try:
-            return self.find_artist(lookup_value)
-        except ObjectDoesNotExist:
-            self.log_not_found("ArtistPage", lookup_value, block_type, block_id)
-            raise
+        return self._find_for_block(
+            self.find_artist,
+            "ArtistPage",
+            lookup_value,
+            block_type,
+            block_id,
+            cache_failures=self.command.finders["artists"].cache_lookup_failures,
+        )
 
     def find_artwork(self, value) -> "ArtworkPage":
         return self.command.finders["artworks"].find(value)
@@ -259,13 +504,14 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
     def find_artwork_for_block(
         self, lookup_value: Union[int, str], block_type: str, block_id: uuid.UUID
     ):
-        if isinstance(lookup_value, str):
-            lookup_value = lookup_value.strip()
-        try:
-            return self.find_artwork(lookup_value)
-        except ObjectDoesNotExist:
-            self.log_not_found("ArtworkPage", lookup_value, block_type, block_id)
-            raise
+        return self._find_for_block(
+            self.find_artwork,
+            "ArtworkPage",
+            lookup_value,
+            block_type,
+            block_id,
+            cache_failures=self.command.finders["artworks"].cache_lookup_failures,
+        )
 
     def find_collection_page(
         self, value
@@ -275,11 +521,16 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
     def find_collection_page_for_block(
         self, lookup_value: str, block_type: str, block_id: uuid.UUID
     ):
-        try:
-            return self.find_collection_page(lookup_value.strip())
-        except ObjectDoesNotExist:
-            self.log_not_found("CollectionPage", lookup_value, block_type, block_id)
-            raise
+        return self._find_for_block(
+            self.find_collection_page,
+            "CollectionPage",
+            lookup_value,
+            block_type,
+            block_id,
+            cache_failures=self.command.finders[
+                "collection_pages"
+            ].cache_lookup_failures,
+        )
 
     def find_event(self, value) -> "EventPage":
         return self.command.finders["events"].find(value)
@@ -287,13 +538,14 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
     def find_event_for_block(
         self, lookup_value: Union[int, str], block_type: str, block_id: uuid.UUID
     ):
-        if isinstance(lookup_value, str):
-            lookup_value = lookup_value.strip()
-        try:
-            return self.find_event(lookup_value)
-        except ObjectDoesNotExist:
-            self.log_not_found("EventPage", lookup_value, block_type, block_id)
-            raise
+        return self._find_for_block(
+            self.find_event,
+            "EventPage",
+            lookup_value,
+            block_type,
+            block_id,
+            cache_failures=self.command.finders["events"].cache_lookup_failures,
+        )
 
     def generate_id(self):
         return uuid.uuid4()
@@ -302,52 +554,81 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
         pass
 
     def remove_redundant_sections(self):
-        value_new = []
-        for section in self.value:
-            if section["type"] not in self.ignore_section_types:
-                value_new.append(section)
-        self.value = value_new
+        if not self.ignore_section_types:
+            return
+        self.value = [
+            section
+            for section in self.value
+            if section["type"] not in self.ignore_section_types
+        ]
 
-    def clean_banners(self):
+    def get_section_handlers(
+        self,
+    ) -> Dict[str, Callable[[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        Return a mapping of section types to methods that convert a single
+        section of that type into a list of zero or more blocks. Sections of
+        any other type are left as they are by ``clean_sections()``.
+        """
+        return {
+            "strip_banner_v2": self.clean_banner,
+            "strip": self.clean_strip,
+            "autostrip": self.clean_autostrip,
+            "article_footer": self.clean_article_footer,
+        }
+
+    def clean_sections(self):
+        handlers = self.get_section_handlers()
         value_new = []
+        append = value_new.append
+        extend = value_new.extend
         for section in self.value:
-            if section["type"] == "strip_banner_v2":
-                value_new.append(self.banner_block_from_api_data(section))
+            handler = handlers.get(section["type"])
+            if handler is None:
+                append(section)
             else:
-                value_new.append(section)
+                extend(handler(section))
         self.value = value_new
 
+    def clean_banner(self, section: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [self.banner_block_from_api_data(section)]
+
+    def clean_strip(self, section: Dict[str, Any]) -> List[Dict[str, Any]]:
+        blocks = []
+        if title := section.get("title", "").strip():
+            blocks.append(self.heading_block_from_title(title, show_in_inpage_nav=True))
+        blocks.append(self.strip_block_from_api_data(section))
+        return blocks
+
+    def clean_autostrip(self, section: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if (
+            section.get("content_type", "") == "auto_content_strip"
+            and section.get("content_category", "") == "press_release"
+        ):
+            # Special case for PressLandingPage
+            return []
+        strip_block = self.get_strip_block_from_api_data(section)
+        if strip_block is None:
+            self.messages.append(f"Removing unsupported 'autostrip': {dump(section)}")
+            return []
+        blocks = []
+        if title := section.get("title", "").strip():
+            blocks.append(self.heading_block_from_title(title, show_in_inpage_nav=True))
+        blocks.append(strip_block)
+        return blocks
+
     def banner_block_from_api_data(self, section: Dict[str, Any]) -> Dict[str, Any]:
         block_id = self.generate_id()
-        height_int = int(section.get("banner_height", 33))
-        if height_int == 33:
-            height = BannerHeightChoices.THIRD
-        elif height_int == 50:
-            height = BannerHeightChoices.HALF
-        elif height_int == 60:
-            height = BannerHeightChoices.SIXTY
-        elif height_int == 70:
-            height = BannerHeightChoices.SEVENTY
-        elif height_int == 80:
-            height = BannerHeightChoices.EIGHTY
-        elif height_int == 90:
-            height = BannerHeightChoices.NINETY
-        else:
-            height = BannerHeightChoices.FULL
-
-        text_alignment = TextAlignmentChoices.CENTERED
-        text_style = TextStyleChoices.BLACK_TEXT
-        for classname in section.get("classes") or []:
-            if "black__overlay" in classname:
-                text_style = TextStyleChoices.BLACK_TEXT_WITH_OVERLAY
-            elif "white__overlay" in classname:
-                text_style = TextStyleChoices.WHITE_TEXT_WITH_OVERLAY
-            elif "white" in classname:
-                text_style = TextStyleChoices.WHITE_TEXT
-            elif "left" in classname:
-                text_alignment = TextAlignmentChoices.LEFT
-            elif "right" in classname:
-                text_alignment = TextAlignmentChoices.RIGHT
+        height = BANNER_HEIGHT_INT_TO_BLOCK_VALUE.get(
+            int(section.get("banner_height", 33)), BannerHeightChoices.FULL
+        )
+
+        options = self.options_from_classes(
+            section.get("classes") or [],
+            BANNER_CLASSNAME_RULES,
+            text_alignment=TextAlignmentChoices.CENTERED,
+            text_style=TextStyleChoices.BLACK_TEXT,
+        )
 
         blocks = self.extract_content_blocks_from_paragraph_text(
             section.get("banner_overlay_content"),
@@ -358,11 +639,14 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
             embed_html_blocks_supported=False,
         )
 
-        text = "".join(rt["value"] for rt in blocks if rt["type"] == "rich_text")
+        text_parts = []
         ctas = []
         for block in blocks:
-            if block["type"] == "cta_row":
+            if block["type"] == "rich_text":
+                text_parts.append(block["value"])
+            elif block["type"] == "cta_row":
                 ctas = block["value"]["items"]
+        text = "".join(text_parts)
 
         background_image = None
         if image_uri := section.get("banner_image"):
@@ -371,7 +655,7 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
                     image_uri, "ImageBanner", block_id
                 ).pk
             except (ObjectDoesNotExist, ValidationError):
-                background_image = self.fallback_image.pk
+                background_image = self.fallback_image_pk
 
         return {
             "type": "banner",
@@ -379,57 +663,20 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
                 "background_image": background_image,
                 "height": height,
                 "text": text,
-                "text_style": text_style,
-                "text_alignment": text_alignment,
+                "text_style": options["text_style"],
+                "text_alignment": options["text_alignment"],
                 "ctas": ctas,
             },
             "id": block_id,
         }
 
-    def clean_strips(self):
-        value_new = []
-        for section in self.value:
-            if section["type"] == "strip":
-                if title := section.get("title", "").strip():
-                    value_new.append(
-                        self.heading_block_from_title(title, show_in_inpage_nav=True)
-                    )
-                value_new.append(self.strip_block_from_api_data(section))
-            else:
-                value_new.append(section)
-        self.value = value_new
-
     def strip_block_from_api_data(self, section: Dict[str, Any]) -> Dict[str, Any]:
         background = section.get("kids_background", "")
         cards = section.get("cards") or section.get("embeds") or []
         columns = COLUMNS_INT_TO_BLOCK_VALUE.get(section.get("columns", len(cards)))
-        layout = ""
-        style = ""
-        for classname in section.get("classes", []):
-            if "carousel" in classname:
-                layout = StripLayoutChoices.CAROUSEL
-            elif "masonry" in classname:
-                layout = StripLayoutChoices.MASONRY
-            elif "title-over-image" in classname:
-                layout = StripLayoutChoices.OVER_IMAGE
-            elif "image-canvas" in classname:
-                layout = StripLayoutChoices.CANVAS
-            elif "border" in classname:
-                layout = StripLayoutChoices.CANVAS_BORDER
-            elif "align" in classname:
-                layout = StripLayoutChoices.CENTER_ALIGN
-            elif "cloud" in classname:
-                layout = StripLayoutChoices.ART_TERMS_TAG_CLOUD
-            elif "portrait" in classname:
-                style = StripStyleChoices.PORTRAIT
-            elif "landscape" in classname:
-                style = StripStyleChoices.LANDSCAPE
-            elif "2-col-mobile" in classname:
-                style = StripStyleChoices.PORTRAIT_2_COL_MOBILE
-            elif "thumbnail" in classname:
-                style = StripStyleChoices.THUMBNAIL
-            elif "alternate" in classname:
-                style = StripStyleChoices.ALTERNATE
+        options = self.options_from_classes(
+            section.get("classes", []), STRIP_CLASSNAME_RULES, layout="", style=""
+        )
 
         return {
             "type": "strip",
@@ -437,36 +684,33 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
                 "background": background,
                 "cards": self.get_card_blocks_from_api_data(cards),
                 "columns": columns,
-                "style": style,
-                "layout": layout,
+                "style": options["style"],
+                "layout": options["layout"],
             },
         }
 
-    def clean_autostrips(self):
-        value_new = []
-        for section in self.value:
-            if (
-                section["type"] == "autostrip"
-                and section.get("content_type", "") == "auto_content_strip"
-                and section.get("content_category", "") == "press_release"
-            ):
-                # Special case for PressLandingPage
-                pass
-            elif section["type"] == "autostrip":
-                strip_block = self.get_strip_block_from_api_data(section)
-                if strip_block is None:
-                    self.messages.append(
-                        f"Removing unsupported 'autostrip': {dump(section)}"
-                    )
-                    continue
-                if title := section.get("title", "").strip():
-                    value_new.append(
-                        self.heading_block_from_title(title, show_in_inpage_nav=True)
-                    )
-                value_new.append(strip_block)
-            else:
-                value_new.append(section)
-        self.value = value_new
+    @staticmethod
+    def options_from_classes(
+        classes: Sequence[str],
+        rules: Sequence[Tuple[str, str, Any]],
+        **defaults: Any,
+    ) -> Dict[str, Any]:
+        """
+        Return a dictionary of option values derived from a list of ``classes``,
+        using the first rule from ``rules`` that matches each classname.
+        """
+        options = defaults
+        for classname in classes:
+            for substring, option_name, value in rules:
+                if substring in classname:
+                    options[option_name] = value
+                    break
+        return options
+
+    def clean_article_footer(self, section: Dict[str, Any]) -> List[Dict[str, Any]]:
+        section["type"] = "main_content_footer"
+        section["value"] = None
+        return [section]
 
     def get_strip_block_from_api_data(
         self, section: Dict[str, Any]
@@ -484,25 +728,34 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
             "value": {"category_id": section["shop_category_id"]},
         }
 
+    @property
+    def venue_ids_by_slug(self) -> Dict[str, int]:
+        if self._venue_ids_by_slug is None:
+            venue_ids = {}
+            for slug, venue_id in EventVenuePage.objects.order_by("pk").values_list(
+                "slug", "id"
+            ):
+                # Slugs are only unique between siblings. Like QuerySet.first(),
+                # use the venue with the lowest ID.
+                venue_ids.setdefault(slug, venue_id)
+            self._venue_ids_by_slug = venue_ids
+        return self._venue_ids_by_slug
+
     def make_event_strip_block(self, section: Dict[str, Any]) -> Dict[str, Any]:
         venue_slug = section.get("gallery_group", "").replace("_", "-")
         venue_ids = []
-        if venue_slug:
-            if venue_slug == "tate-st-ives":
-                venue_ids.extend(
-                    EventVenuePage.objects.filter(
-                        slug__in=[
-                            "tate-st-ives",
-                            "barbara-hepworth-museum-and-sculpture-garden",
-                        ]
-                    ).values_list("id", flat=True)
-                )
-            else:
-                venue = (
-                    EventVenuePage.objects.filter(slug=venue_slug).values("id").first()
-                )
-                if venue:
-                    venue_ids.append(venue["id"])
+        if venue_slug == "tate-st-ives":
+            venue_slugs = (
+                "tate-st-ives",
+                "barbara-hepworth-museum-and-sculpture-garden",
+            )
+        elif venue_slug:
+            venue_slugs = (venue_slug,)
+        else:
+            venue_slugs = ()
+        for slug in venue_slugs:
+            if (venue_id := self.venue_ids_by_slug.get(slug)) is not None:
+                venue_ids.append(venue_id)
         return {
             "type": "event_strip",
             "value": {
@@ -521,7 +774,7 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
             "value": {
                 "text": title,
                 "show_in_inpage_nav": show_in_inpage_nav,
-                "html_id": slugify(title),
+                "html_id": slugify_cached(title),
             },
         }
 
@@ -530,12 +783,6 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
         self.group_content_into_sections()
         self.clean_section_blocks()
 
-    def clean_article_footers(self):
-        for section in self.value:
-            if section["type"] == "article_footer":
-                section["type"] == "main_content_footer"
-                section["value"] = None
-
     def add_accordion_blocks(self):
         """
         'collapsed' page sections with simple heading text and content are to be
@@ -544,6 +791,7 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
         them within an 'accordion' block value.
         """
         value_new = []
+        append = value_new.append
         accordion_items = []
         for section in self.value:
             if (
@@ -566,18 +814,27 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
                     }
                 )
             else:
-                self._add_accordion_block(accordion_items, to=value_new)
-                value_new.append(section)
+                accordion_items = self._add_accordion_block(
+                    accordion_items, to=value_new
+                )
+                append(section)
 
         # In case there are remaining 'accordion_items'
         self._add_accordion_block(accordion_items, to=value_new)
         self.value = value_new
 
-    def _add_accordion_block(self, items: Sequence[Dict[str, Any]], to: List[Dict]):
+    def _add_accordion_block(
+        self, items: List[Dict[str, Any]], to: List[Dict]
+    ) -> List[Dict[str, Any]]:
+        """
+        Add an 'accordion' block with ``items`` as its children to ``to``, and
+        return a new list for the caller to use to collect further items. The
+        ``items`` list is used as-is, so should not be modified after calling this.
+        """
         if not items:
-            return
-        to.append({"type": "accordion", "value": {"children": list(items)}})
-        items.clear()
+            return items
+        to.append({"type": "accordion", "value": {"children": items}})
+        return []
 
     def group_content_into_sections(self):
         """
@@ -587,13 +844,16 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
         them under fake 'section' blocks to better resemble the target structure.
         """
         value_new = []
+        append = value_new.append
         section_contents = []
         for section in self.value:
-            if section["type"] in ["accordion", "page_section"]:
+            if section["type"] in SECTION_CONTENT_TYPES:
                 section_contents.append(section)
             else:
-                self._add_section_block(section_contents, to=value_new)
-                value_new.append(section)
+                section_contents = self._add_section_block(
+                    section_contents, to=value_new
+                )
+                append(section)
 
         # In case there are remaining 'section_contents'
         self._add_section_block(section_contents, to=value_new)
@@ -601,24 +861,29 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
 
     def _add_section_block(
         self,
-        contents: Sequence[Dict[str, Any]],
+        contents: List[Dict[str, Any]],
         to: List[Dict[str, Any]],
         background: str = None,
-    ):
+    ) -> List[Dict[str, Any]]:
+        """
+        Add a 'section' block with ``contents`` as its content to ``to``, and
+        return a new list for the caller to use to collect further content. The
+        ``contents`` list is used as-is, so should not be modified after calling this.
+        """
         if not contents:
-            return
+            return contents
 
         block = {
             "type": "section",
             "value": {
-                "content": list(contents),
+                "content": contents,
             },
         }
         if background:
             block["value"]["background"] = background
 
         to.append(block)
-        contents.clear()
+        return []
 
     def clean_section_blocks(self):
         for section in self.value:
@@ -630,28 +895,27 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
 
     def _clean_section_block_contents(self, value: Sequence[Dict[str, Any]]):
         blocks = []
+        append = blocks.append
         for block in value:
             if block["type"] == "page_section":
                 if heading := block.pop("heading", "").strip():
-                    blocks.append({"type": "heading", "value": {"text": heading}})
+                    append({"type": "heading", "value": {"text": heading}})
 
-                media_blocks = []
+                # NOTE: This is a generator, so blocks are only created
+                # when added to 'blocks' below
+                media_blocks = ()
                 if block.get("embeds"):
-                    media_blocks.extend(
-                        self._extract_media_blocks_from_page_section(block)
-                    )
+                    media_blocks = self._extract_media_blocks_from_page_section(block)
 
-                text_blocks = []
+                text_blocks = ()
                 if text := block.get("text"):
-                    text_blocks.extend(
-                        self.extract_content_blocks_from_paragraph_text(
-                            text,
-                            allow_h2_in_richtext=False,
-                            heading_blocks_supported=True,
-                            cta_row_blocks_supported=True,
-                            table_html_blocks_supported=True,
-                            embed_html_blocks_supported=True,
-                        )
+                    text_blocks = self.extract_content_blocks_from_paragraph_text(
+                        text,
+                        allow_h2_in_richtext=False,
+                        heading_blocks_supported=True,
+                        cta_row_blocks_supported=True,
+                        table_html_blocks_supported=True,
+                        embed_html_blocks_supported=True,
                     )
 
                 if block.get("text_first", False):
@@ -662,12 +926,14 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
                     blocks.extend(text_blocks)
 
             else:
-                blocks.append(block)
+                append(block)
         return blocks
 
     def _extract_media_blocks_from_page_section(self, value):
-        embeds = value.get("embeds")
-        used_embed_types = set(item["type"] for item in embeds)
+        embeds = value.get("embeds") or ()
+        used_embed_types = {item["type"] for item in embeds}
+        if not used_embed_types:
+            return
         block_classnames = value.get("classes") or []
         media_style = self.media_style_from_classes(block_classnames)
         if used_embed_types in ({"image"}, {"artwork"}, {"artwork", "image"}):
@@ -695,26 +961,22 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
                     "type": "image_gallery",
                     "value": {"images": image_blocks, "style": media_style, "text": ""},
                 }
-        elif any(
-            bool(et in used_embed_types) for et in API_EMBED_TYPE_TO_FIGURE_TYPE.keys()
-        ):
+        elif not used_embed_types.isdisjoint(FIGURE_EMBED_TYPES):
             # A series of 'Figure' blocks become a `FiguresBlock` value
             yield {
                 "type": "figures",
                 "value": {
-                    "figures": self.get_figure_blocks_from_api_data(value["embeds"]),
+                    "figures": self.get_figure_blocks_from_api_data(embeds),
                     "style": media_style,
                 },
             }
 
-        elif any(
-            bool(et in used_embed_types) for et in API_EMBED_TYPE_TO_CARD_TYPE.keys()
-        ):
+        elif not used_embed_types.isdisjoint(CARD_EMBED_TYPES):
             # A series of 'Card' blocks become a `CardsBlock` value
             yield {
                 "type": "cards",
                 "value": {
-                    "cards": self.get_card_blocks_from_api_data(value["embeds"]),
+                    "cards": self.get_card_blocks_from_api_data(embeds),
                     "style": media_style,
                 },
             }
@@ -805,22 +1067,33 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
         # parented by a block element. Each series will be added as a new <p> tag
         inline_elements = []
 
-        # Temporary store for series of block-level html elements strings that should
-        # make up the contents of a 'richtext' value. `inline_elements` may be combined
-        # into a <p> and added to this list.
+        # Temporary store for series of block-level html elements (or strings) that
+        # should make up the contents of a 'richtext' value. `inline_elements` may be
+        # combined into a <p> and added to this list.
         richtext_segments = []
 
-        richtext_block_names = RICHTEXT_BLOCK_ELEMENT_NAMES
+        parse_richtext = self.parse_richtext
+
+        def add_block(block: Dict[str, Any]):
+            # Only close the current richtext block when another type of block
+            # follows it, so that richtext either side of content that is
+            # dropped or merged is kept together and parsed once
+            add_richtext_block(
+                richtext_segments, to=blocks, parse_richtext=parse_richtext
+            )
+            blocks.append(block)
+
         if allow_h2_in_richtext:
-            richtext_block_names = richtext_block_names + ("h2",)
+            richtext_block_names = RICHTEXT_BLOCK_ELEMENT_NAMES_WITH_H2
+        else:
+            richtext_block_names = RICHTEXT_BLOCK_ELEMENT_NAMES
 
         soup = self.get_soup(value)
 
         # Strip and log removal of <style>, <script> and <link> tags
-        for tag_name in ("style", "script", "link"):
-            for tag in soup.find_all(tag_name):
-                self.messages.append(f"<{tag_name}> tag removed from content: {tag}")
-                tag.extract()
+        for tag in soup.find_all(["style", "script", "link"]):
+            self.messages.append(f"<{tag.name}> tag removed from content: {tag}")
+            tag.decompose()
 
         for elem in soup.contents:
             if (
@@ -837,23 +1110,20 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
                 ):
                     inline_elements.append("<br>")
                 else:
-                    self._add_paragraph_from_inline_elements(
+                    add_paragraph_from_inline_elements(
                         inline_elements, to=richtext_segments
                     )
                     richtext_segments.append("<br>")
 
-            elif buttons := elem.find_all("a", class_="btn"):
+            elif buttons := (scan := self._scan_child(elem))["btns"]:
                 if cta_row_blocks_supported:
                     # Close the current series of inline elements
-                    self._add_paragraph_from_inline_elements(
+                    add_paragraph_from_inline_elements(
                         inline_elements, to=richtext_segments
                     )
 
-                    # Close the current richtext block
-                    self._add_richtext_block(richtext_segments, to=blocks)
-
                     # Add button(s) as `CTARowBlock` value
-                    blocks.append(
+                    add_block(
                         {
                             "type": "cta_row",
                             "value": {
@@ -869,33 +1139,30 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
 
             elif elem.name in richtext_block_names:
                 # Close the current series of inline elements
-                self._add_paragraph_from_inline_elements(
+                add_paragraph_from_inline_elements(
                     inline_elements, to=richtext_segments
                 )
                 # Add this element to the current richtext block
-                richtext_segments.append(str(elem))
+                richtext_segments.append(elem)
             elif elem.name == "h2" and not heading_blocks_supported:
                 # Close the current series of inline elements
-                self._add_paragraph_from_inline_elements(
+                add_paragraph_from_inline_elements(
                     inline_elements, to=richtext_segments
                 )
 
                 # Add h2 as a h3 to avoid losing the content
                 elem.name = "h3"
-                richtext_segments.append(str(elem))
+                richtext_segments.append(elem)
             else:
                 # Close the current series of inline elements
-                self._add_paragraph_from_inline_elements(
+                add_paragraph_from_inline_elements(
                     inline_elements, to=richtext_segments
                 )
-                # Close the current richtext block
-                self._add_richtext_block(richtext_segments, to=blocks)
-
                 # Add h2s as `HeadingBlock` values if supported
                 if elem.name == "h2":
                     text = elem.get_text().strip()
                     if text and heading_blocks_supported:
-                        blocks.append(
+                        add_block(
                             {
                                 "type": "heading",
                                 "value": {
@@ -906,18 +1173,18 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
                         )
 
                 # Add blockquotes as `QuoteBlock` values
-                elif elem.name == "blockquote" and "instagram-media" not in elem.get(
-                    "class", ""
+                elif elem.name == "blockquote" and "instagram-media" not in (
+                    elem.get("class") or ()
                 ):
-                    text = "".join(str(e) for e in elem.contents)
+                    text = "".join([str(e) for e in elem.contents])
                     attribution = ""
                     for separator in ("<br />", "&ndash;"):
-                        if separator in text:
-                            text_split = text.split(separator)
-                            attribution = "<p>" + text_split.pop().strip() + "</p>"
-                            text = separator.join(text_split) + "</p>"
+                        head, found, tail = text.rpartition(separator)
+                        if found:
+                            attribution = "<p>" + tail.strip() + "</p>"
+                            text = head + "</p>"
                             break
-                    blocks.append(
+                    add_block(
                         {
                             "type": "quote",
                             "value": {
@@ -928,8 +1195,8 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
                     )
 
                 # Add table HTML as `TableBlock` value
-                elif elem.name == "table" or elem.find("table"):
-                    if len(elem.find_all("td")) == 1:
+                elif elem.name == "table" or scan["has_table"]:
+                    if scan["td_count"] == 1:
                         # Extract content from single-column tables
                         content = self.parse_richtext(str(elem))
                         richtext_segments.append(content)
@@ -939,7 +1206,7 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
                         )
 
                     elif table_html_blocks_supported:
-                        blocks.append(
+                        add_block(
                             {
                                 "type": "table_html",
                                 # Use a block instance to sanitize the value
@@ -950,9 +1217,9 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
                         self.messages.append(f"<table> dropped from content: {elem}")
 
                 # Add iframe HTML a EmbedHTMLBlock values
-                elif elem.name == "iframe" or elem.find(["iframe"]):
+                elif elem.name == "iframe" or scan["has_iframe"]:
                     if embed_html_blocks_supported:
-                        blocks.append(
+                        add_block(
                             {
                                 "type": "embed_html",
                                 # Use block instance to sanitize the value
@@ -964,38 +1231,55 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
 
                 elif elem.name == "div":
                     # Close the current series of inline elements
-                    self._add_paragraph_from_inline_elements(
+                    add_paragraph_from_inline_elements(
                         inline_elements, to=richtext_segments
                     )
-                    if not elem.find("p"):
+                    if not scan["has_p"]:
                         elem.name = "p"
                     # Add this element to the current richtext block
-                    richtext_segments.append(str(elem))
+                    richtext_segments.append(elem)
 
                 else:
                     self.messages.append(f"<{elem.name}> removed from content: {elem}")
 
         # In case there are remaining 'inline_elements'
-        self._add_paragraph_from_inline_elements(inline_elements, to=richtext_segments)
+        add_paragraph_from_inline_elements(inline_elements, to=richtext_segments)
         # In case there are remaining 'richtext_segments'
-        self._add_richtext_block(richtext_segments, to=blocks)
+        add_richtext_block(richtext_segments, to=blocks, parse_richtext=parse_richtext)
         return blocks
 
-    def _add_paragraph_from_inline_elements(
-        self, inline_elements: Sequence[str], to: List[str]
-    ):
-        if not inline_elements:
-            return
-        to.append("<p>" + " ".join(inline_elements) + "</p>")
-        inline_elements.clear()
-
-    def _add_richtext_block(self, segments: Sequence[str], to: List[Dict[str, Any]]):
-        if not segments:
-            return
-        to.append(
-            {"type": "rich_text", "value": self.parse_richtext("".join(segments))}
-        )
-        segments.clear()
+    @staticmethod
+    def _scan_child(elem: Tag) -> Dict[str, Any]:
+        """
+        Walk the descendants of ``elem`` once, collecting any ``<a class="btn">``
+        tags, counting ``<td>`` tags and noting whether ``<table>``, ``<iframe>``
+        or ``<p>`` tags are present, so that the branches in
+        ``extract_content_blocks_from_paragraph_text()`` don't each have to
+        search the subtree again.
+        """
+        scan = {
+            "btns": [],
+            "has_table": False,
+            "has_iframe": False,
+            "has_p": False,
+            "td_count": 0,
+        }
+        for descendant in elem.descendants:
+            if not isinstance(descendant, Tag):
+                continue
+            name = descendant.name
+            if name == "a":
+                if "btn" in (descendant.get("class") or ()):
+                    scan["btns"].append(descendant)
+            elif name == "table":
+                scan["has_table"] = True
+            elif name == "iframe":
+                scan["has_iframe"] = True
+            elif name == "p":
+                scan["has_p"] = True
+            elif name == "td":
+                scan["td_count"] += 1
+        return scan
 
     def cta_block_from_button_tag(self, button: Tag):
         if span := button.find("span"):
@@ -1007,36 +1291,63 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
 
         # derive 'style' value from classnames
         style = ""
-        for c in button.get_attribute_list("class"):
-            if "btn--type" in c:
+        for c in button.get("class") or ():
+            if c.startswith("btn--type__"):
                 style = c.replace("btn--type__", "")
+                break
 
         # derive 'icon' value from icon classnames
         icon = ""
         icon_element = button.find("i")
         if icon_element:
-            for c in icon_element.get_attribute_list("class"):
-                if "icon--" in c:
+            for c in icon_element.get("class") or ():
+                if c.startswith("icon--"):
                     icon = c.replace("icon--", "")
+                    break
 
         return self.make_cta_block(label, url, style, icon)
 
-    def make_cta_block(self, label: str, url: str, style: str = "", icon: str = ""):
+    def get_cta_target(
+        self, url: str
+    ) -> Tuple[ParseResult, Optional[int], Optional[int]]:
+        """
+        Return a ``(parsed_url, document_pk, page_pk)`` tuple for the supplied CTA
+        ``url``, where the primary keys are ``None`` if no match was found. Finders
+        that do not support ``find_pk()`` are supported (see ``BaseParser._find_pk()``).
+
+        The same buttons tend to appear several times in a value, so results are
+        kept until the next ``parse()`` call (unless the relevant finder is
+        configured not to cache lookup failures).
+        """
+        try:
+            return self._cta_targets[url]
+        except KeyError:
+            pass
+
         document = None
         page = None
+        cacheable = True
         parsed_url = urlparse(url)
 
         if self.document_finder.looks_like_document_url(parsed_url):
             try:
-                document = self.find_document(url).pk
+                document = self.find_document_pk(url)
             except ObjectDoesNotExist:
-                pass
+                cacheable = self.document_finder.cache_lookup_failures
 
         elif self.page_finder.looks_like_page_url(parsed_url):
             try:
-                page = self.find_page(url).pk
+                page = self.find_page_pk(url)
             except ObjectDoesNotExist:
-                pass
+                cacheable = self.page_finder.cache_lookup_failures
+
+        result = (parsed_url, document, page)
+        if cacheable:
+            self._cta_targets[url] = result
+        return result
+
+    def make_cta_block(self, label: str, url: str, style: str = "", icon: str = ""):
+        parsed_url, document, page = self.get_cta_target(url)
 
         if document:
             return {
@@ -1049,14 +1360,11 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
             }
 
         if page:
-            fragment = ""
-            if "#" in url:
-                fragment = url.split("#").pop()
             return {
                 "type": "page",
                 "value": {
                     "page": page,
-                    "fragment": fragment,
+                    "fragment": parsed_url.fragment,
                     "label": label,
                     "style": style,
                     "icon": icon,
@@ -1088,7 +1396,7 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
             ).pk
             legacy_id = None
         except (ObjectDoesNotExist, ValidationError):
-            image_id = self.fallback_image.pk
+            image_id = self.fallback_image_pk
             legacy_id = data["uri"]
         return {
             "type": "image",
@@ -1109,7 +1417,7 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
             ).master_image_id
             legacy_id = None
         except ObjectDoesNotExist:
-            image_id = self.fallback_image.pk
+            image_id = self.fallback_image_pk
             legacy_id = data["id"]
         return {
             "type": "image",
@@ -1143,7 +1451,7 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
             except (ObjectDoesNotExist, ValidationError):
                 pass
 
-        return self.fallback_image.pk
+        return self.fallback_image_pk
 
     # -------------------------------------------------------------------------
     # Card blocks
@@ -1151,36 +1459,37 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
 
     def get_card_blocks_from_api_data(self, data):
         blocks = []
+        append = blocks.append
+        make_block = self.card_block_from_api_data
         for item in data:
-            block = self.card_block_from_api_data(item)
+            block = make_block(item)
             if block is not None:
-                blocks.append(block)
+                append(block)
         return blocks
 
+    @cached_property
+    def card_block_makers(self) -> Dict[str, Callable[..., Optional[Dict[str, Any]]]]:
+        """
+        A mapping of card block types to the methods that create a block of
+        that type from API data.
+        """
+        return {
+            "page": self.make_page_card_block,
+            "event": self.make_event_card_block,
+            "artist": self.make_artist_card_block,
+            "external": self.make_external_card_block,
+            "shop_product": self.make_shop_product_card_block,
+            "promo": self.make_promo_card_block,
+            "artwork": self.make_artwork_card_block,
+        }
+
     def card_block_from_api_data(self, data):
         block_id = self.generate_id()
         block_type = API_EMBED_TYPE_TO_CARD_TYPE.get(data["type"])
 
-        if block_type == "page":
-            return self.make_page_card_block(data, block_id)
-
-        if block_type == "event":
-            return self.make_event_card_block(data, block_id)
-
-        if block_type == "artist":
-            return self.make_artist_card_block(data, block_id)
-
-        if block_type == "external":
-            return self.make_external_card_block(data, block_id)
-
-        if block_type == "shop_product":
-            return self.make_shop_product_card_block(data, block_id)
-
-        if block_type == "promo":
-            return self.make_promo_card_block(data, block_id)
-
-        if block_type == "artwork":
-            return self.make_artwork_card_block(data, block_id)
+        make_block = self.card_block_makers.get(block_type)
+        if make_block is not None:
+            return make_block(data, block_id)
 
         raise ValidationError(
             f"Card type '{block_type}' not recognised. Cannot convert:\n\n {dump(data)}"
@@ -1271,7 +1580,7 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
             product_id = data["id"]
         elif url := data.get("url"):
             # This was a 'shop' card: Extract product ID from URL
-            if product_id_result := re.search(r"([a-z0-9]{4,10})[^-/]+$", url):
+            if product_id_result := SHOP_PRODUCT_ID_REGEX.search(url):
                 product_id = product_id_result.group(1)
             else:
                 raise ValidationError(f"Could not extract product ID from: '{url}'.")
@@ -1337,27 +1646,36 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
 
     def get_figure_blocks_from_api_data(self, data):
         blocks = []
+        append = blocks.append
+        make_block = self.figure_block_from_api_data
         for item in data:
-            block = self.figure_block_from_api_data(item)
+            block = make_block(item)
             if block is not None:
-                blocks.append(block)
+                append(block)
         return blocks
 
+    @cached_property
+    def figure_block_makers(
+        self,
+    ) -> Dict[str, Callable[..., Optional[Dict[str, Any]]]]:
+        """
+        A mapping of figure block types to the methods that create a block of
+        that type from API data.
+        """
+        return {
+            "column": self.make_column_figure_block,
+            "quote": self.make_quote_figure_block,
+            "legacy_embed": self.make_legacy_embed_figure_block,
+            "image": self.make_image_figure_block,
+        }
+
     def figure_block_from_api_data(self, data):
         block_id = self.generate_id()
         block_type = API_EMBED_TYPE_TO_FIGURE_TYPE.get(data["type"])
 
-        if block_type == "column":
-            return self.make_column_figure_block(data, block_id)
-
-        if block_type == "quote":
-            return self.make_quote_figure_block(data, block_id)
-
-        if block_type == "legacy_embed":
-            return self.make_legacy_embed_figure_block(data, block_id)
-
-        if block_type == "image":
-            return self.make_image_figure_block(data, block_id)
+        make_block = self.figure_block_makers.get(block_type)
+        if make_block is not None:
+            return make_block(data, block_id)
 
         raise ValidationError(
             f"Figure type '{block_type}' not recognised. Cannot convert:\n\n {dump(data)}"
@@ -1411,7 +1729,7 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
                     data["id"], "ImageFigureBlock", block_id
                 ).master_image_id
             except ObjectDoesNotExist:
-                image_id = self.fallback_image.pk
+                image_id = self.fallback_image_pk
         else:
             try:
                 image_id = self.find_or_download_image_for_block(
@@ -1422,7 +1740,7 @@ class StreamFieldContentParser(BaseRichTextContainingParser):
                     caption=data.get("caption", ""),
                 ).pk
             except (ObjectDoesNotExist, ValidationError):
-                image_id = self.fallback_image.pk
+                image_id = self.fallback_image_pk
         return {
             "type": "image",
             "value": {
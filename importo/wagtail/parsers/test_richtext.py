@@ -0,0 +1,153 @@
+import logging
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from django.core.exceptions import ObjectDoesNotExist
+
+from .richtext import RichTextParser
+
+
+class ProjectFinder:
+    """
+    Mimics the API of the finders that projects share with parsers, which
+    can only return whole objects (there is no ``find_pk()``).
+    """
+
+    def __init__(self, objects, url_prefix):
+        self.objects = objects
+        self.url_prefix = url_prefix
+        self.looked_up = []
+
+    def find(self, value):
+        self.looked_up.append(value)
+        try:
+            return self.objects[value]
+        except KeyError:
+            raise ObjectDoesNotExist(f"No match for '{value}'")
+
+    def looks_like_url(self, parse_result):
+        return parse_result.path.startswith(self.url_prefix)
+
+    looks_like_document_url = looks_like_url
+    looks_like_page_url = looks_like_url
+
+
+@pytest.fixture
+def parser():
+    command = SimpleNamespace(
+        logger=logging.getLogger(__name__),
+        finders={
+            "documents": ProjectFinder(
+                {"/files/report.pdf": SimpleNamespace(pk=1)}, "/files/"
+            ),
+            "pages": ProjectFinder({"/about/": SimpleNamespace(pk=2)}, "/"),
+        },
+    )
+    return RichTextParser(command)
+
+
+def test_parse_empty_value(parser):
+    assert parser.parse("") == ""
+    assert parser.parse(None) == ""
+
+
+def test_parse_replaces_tags(parser):
+    assert (
+        parser.parse("<p><b>Bold</b> and <i>italic</i></p><h5>Heading</h5>")
+        == "<p><strong>Bold</strong> and <em>italic</em></p><p>Heading</p>"
+    )
+
+
+def test_parse_unwraps_nested_disallowed_tags(parser):
+    assert (
+        parser.parse("<div><span><p>Text <font><b>here</b></font></p></span></div>")
+        == "<p>Text <strong>here</strong></p>"
+    )
+
+
+def test_parse_removes_disallowed_attributes_at_every_depth(parser):
+    assert (
+        parser.parse(
+            '<p style="color: red"><span><a href="https://example.com" '
+            'onclick="go()" title="Example">Link</a></span></p>'
+        )
+        == '<p><a href="https://example.com" title="Example">Link</a></p>'
+    )
+
+
+def test_parse_converts_footnote_links(parser):
+    footnote_id = uuid.uuid3(uuid.NAMESPACE_DNS, "123456")
+    assert parser.parse('<p>Text<a href="#footnote_2_123456">2</a></p>') == (
+        f'<p>Text<footnote id="{footnote_id}">[{str(footnote_id)[:6]}]</footnote></p>'
+    )
+
+
+def test_parse_link_replacement_only(parser):
+    value = '<div><b style="color: red">Text</b><a href="#footnote_1">1</a></div>'
+    assert parser.parse(value, link_replacement_only=True) == value
+
+
+def test_parse_matches_separate_passes(parser):
+    value = (
+        '<div><h6>Title</h6><p class="intro"><span><i>Text</i></span>'
+        '<a href="#footnote_1_654321">1</a></p></div>'
+    )
+    expected = parser.parse(value)
+
+    parser.soup = parser.get_soup(value)
+    parser.replace_tags()
+    parser.remove_unwanted_html()
+    parser.update_footnote_links()
+    assert str(parser.soup) == expected
+
+
+def test_remove_unwanted_html_for_tag(parser):
+    parser.soup = parser.get_soup(
+        '<p class="a"><span class="b">One</span></p><div class="c">Two</div>'
+    )
+    parser.remove_unwanted_html(parser.soup.p)
+    assert str(parser.soup) == '<p>One</p><div class="c">Two</div>'
+
+
+@pytest.mark.parametrize(
+    "href",
+    [
+        "#section",
+        "?page=2",
+        "mailto:info@example.com",
+        "tel:+441234567890",
+        "javascript:void(0)",
+        "https://www.example.com/some/page",
+    ],
+)
+def test_parse_leaves_unmatchable_links_alone(parser, href):
+    value = f'<p><a href="{href}">Link</a></p>'
+    assert parser.parse(value) == value
+    # These links are not expected to match, so are not reported
+    assert parser.link_match_errors == []
+    assert parser.document_finder.looked_up == []
+    assert parser.page_finder.looked_up == []
+
+
+def test_parse_updates_internal_links(parser):
+    assert parser.parse(
+        '<p><a href="/files/report.pdf">Report</a> <a href="/about/">About</a></p>'
+    ) == (
+        '<p><a id="1" linktype="document">Report</a> '
+        '<a id="2" linktype="page">About</a></p>'
+    )
+    assert parser.link_match_errors == []
+
+
+def test_parse_reports_unmatched_internal_links(parser):
+    value = (
+        '<p><a href="/files/missing.pdf">Report</a> <a href="/missing/">Page</a></p>'
+    )
+    assert parser.parse(value) == value
+    assert [e.msg for e in parser.link_match_errors] == [
+        "Failed to update richtext link",
+        "Failed to update richtext link",
+    ]
+    assert parser.document_finder.looked_up == ["/files/missing.pdf"]
+    assert parser.page_finder.looked_up == ["/missing/"]
@@ -0,0 +1,214 @@
+import io
+import logging
+from types import SimpleNamespace
+from urllib.parse import urlparse
+
+import pytest
+from django.core.exceptions import ObjectDoesNotExist
+
+from importo.fields import ImageFileField
+
+# The parser converts content into blocks defined by the project
+pytest.importorskip("tate")
+
+from . import streamfield  # noqa: E402
+from .streamfield import StreamFieldContentParser  # noqa: E402
+
+BANNER_IMAGE_URL = "https://www.tate.org.uk/sites/default/files/banner.jpg"
+
+
+class ProjectFinder:
+    """
+    Mimics the project's finders, which can find objects by URL but do not
+    support ``find_pk()``.
+    """
+
+    cache_lookup_failures = True
+
+    def __init__(self, objects=None, url_prefix=""):
+        self.objects = objects or {}
+        self.url_prefix = url_prefix
+        self.looked_up = []
+
+    def find(self, value):
+        self.looked_up.append(value)
+        try:
+            return self.objects[urlparse(value).path]
+        except KeyError:
+            raise ObjectDoesNotExist
+
+    def add_to_cache(self, value, result):
+        pass
+
+    def looks_like_url(self, parsed_url):
+        return parsed_url.path.startswith(self.url_prefix)
+
+    looks_like_document_url = looks_like_page_url = looks_like_url
+
+
+class ImportoImageFieldParser(StreamFieldContentParser):
+    def get_image_field(self):
+        return ImageFileField(source="file", target_field="file", command=self.command)
+
+
+def get_parser(parser_class=StreamFieldContentParser):
+    command = SimpleNamespace(
+        logger=logging.getLogger(__name__),
+        finders={
+            "documents": ProjectFinder(
+                {"/files/report.pdf": SimpleNamespace(pk=1)}, "/files/"
+            ),
+            "images": ProjectFinder(),
+            "pages": ProjectFinder({"/visit/": SimpleNamespace(pk=2)}, "/visit"),
+        },
+    )
+    return parser_class(command)
+
+
+@pytest.mark.django_db
+def test_parse_with_default_image_field():
+    # The project's image field is used, which might not support prefetching
+    parser = get_parser()
+    assert parser.parse([]) == []
+    assert parser.parse([{"type": "unknown", "value": "x"}]) == [
+        {"type": "unknown", "value": "x"}
+    ]
+    parser.close()
+
+
+@pytest.mark.django_db
+def test_prefetched_images_picked_up_by_image_field(mocker):
+    fetch_file = mocker.patch(
+        "importo.utils.io.fetch_file", return_value=io.BytesIO(b"data")
+    )
+    parser = get_parser(ImportoImageFieldParser)
+    parser.value = [{"type": "strip_banner_v2", "banner_image": "public://banner.jpg"}]
+    parser._finder_cache = {}
+    parser.prefetch_images()
+    fetch_file.assert_called_once_with(BANNER_IMAGE_URL, add_hash=True, max_retries=3)
+
+    # The field picks up the prefetched file instead of downloading it again
+    uploaded_file = parser.image_field.to_python(BANNER_IMAGE_URL)
+    assert uploaded_file.read() == b"data"
+    fetch_file.assert_called_once()
+    parser.close()
+
+
+def test_close_shuts_down_image_download_executor():
+    parser = get_parser()
+    # Closing before any downloads are prefetched is a no-op
+    parser.close()
+    assert "image_download_executor" not in parser.__dict__
+
+    executor = parser.image_download_executor
+    with parser:
+        pass
+    assert executor._shutdown
+    assert "image_download_executor" not in parser.__dict__
+
+
+def test_make_cta_block_with_finders_lacking_find_pk():
+    parser = get_parser()
+    assert parser.make_cta_block("Report", "/files/report.pdf", "primary") == {
+        "type": "document",
+        "value": {"document": 1, "label": "Report", "style": "primary"},
+    }
+    assert parser.make_cta_block("Visit", "/visit/#hours") == {
+        "type": "page",
+        "value": {
+            "page": 2,
+            "fragment": "hours",
+            "label": "Visit",
+            "style": "",
+            "icon": "",
+        },
+    }
+    for url in ("/visit/missing/", "https://example.com/"):
+        assert parser.make_cta_block("Go", url) == {
+            "type": "url",
+            "value": {"url": url, "label": "Go", "style": "", "icon": ""},
+        }
+
+    # Repeat lookups are served from the parser's cache
+    parser.make_cta_block("Visit", "/visit/#hours")
+    parser.make_cta_block("Go", "/visit/missing/")
+    assert parser.document_finder.looked_up == ["/files/report.pdf"]
+    assert parser.page_finder.looked_up == ["/visit/#hours", "/visit/missing/"]
+
+    # Pages created between parse() runs are found by later runs
+    parser.parse([])
+    parser.page_finder.objects["/visit/missing/"] = SimpleNamespace(pk=3)
+    assert parser.make_cta_block("Go", "/visit/missing/")["value"]["page"] == 3
+
+
+def test_make_event_strip_block_venues(mocker):
+    venues = mocker.patch.object(streamfield.EventVenuePage, "objects")
+    venues.order_by.return_value.values_list.return_value = [
+        ("tate-st-ives", 1),
+        ("barbara-hepworth-museum-and-sculpture-garden", 2),
+        ("tate-modern", 3),
+        ("tate-modern", 4),
+    ]
+    parser = get_parser()
+    assert parser.make_event_strip_block({"gallery_group": "tate_st_ives"})["value"][
+        "venues"
+    ] == [1, 2]
+    # Duplicate slugs resolve to the venue with the lowest ID
+    assert parser.make_event_strip_block({"gallery_group": "tate_modern"})["value"][
+        "venues"
+    ] == [3]
+    assert parser.make_event_strip_block({})["value"]["venues"] == []
+    venues.order_by.assert_called_once_with("pk")
+
+    # Venues are reloaded for each parse() run
+    parser.parse([])
+    assert parser.make_event_strip_block({"gallery_group": "tate_modern"})["value"][
+        "venues"
+    ] == [3]
+    assert venues.order_by.call_count == 2
+    parser.close()
+
+
+def test_extract_content_blocks_from_paragraph_text():
+    table = "<table><tr><td>A</td><td>B</td></tr></table>"
+    value = (
+        "<p>Intro</p><div>Aside</div><table><tr><td>Only</td></tr></table>"
+        f"<section>Dropped</section><p>More</p>{table}<p>After</p>"
+        '<p><a class="btn btn--type__primary" href="https://example.com/">Go</a></p>'
+        "<p>End</p>"
+    )
+    parser = get_parser()
+    parser.messages = []
+    # Richtext is only split where another block is added. Divs, single-column
+    # tables and dropped elements used to start a new rich_text block each.
+    assert parser.extract_content_blocks_from_paragraph_text(value) == [
+        {"type": "rich_text", "value": "<p>Intro</p><p>Aside</p>Only<p>More</p>"},
+        {
+            "type": "table_html",
+            "value": streamfield.TableBlock().value_from_form(table),
+        },
+        {"type": "rich_text", "value": "<p>After</p>"},
+        {
+            "type": "cta_row",
+            "value": {
+                "items": [
+                    {
+                        "type": "url",
+                        "value": {
+                            "url": "https://example.com/",
+                            "label": "Go",
+                            "style": "primary",
+                            "icon": "",
+                        },
+                    }
+                ],
+                "alignment": streamfield.CTARowAlignmentChoices.LEFT,
+            },
+        },
+        {"type": "rich_text", "value": "<p>End</p>"},
+    ]
+    assert parser.messages == [
+        "Single-column <table> dropped from content. The following content was "
+        "extracted: Only",
+        "<section> removed from content: <section>Dropped</section>",
+    ]
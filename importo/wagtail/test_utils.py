@@ -0,0 +1,60 @@
+import pytest
+from wagtail.models import Page
+
+from .utils import get_unique_slug
+
+
+@pytest.fixture
+def parent(db):
+    root = Page.get_first_root_node()
+    return root.add_child(instance=Page(title="Parent", slug="parent"))
+
+
+def add_children(parent, *slugs):
+    for slug in slugs:
+        parent.add_child(instance=Page(title=slug, slug=slug))
+
+
+def test_without_parent():
+    assert get_unique_slug(Page(title="Foo"), None) == "foo"
+
+
+def test_no_collision(parent):
+    add_children(parent, "bar")
+    assert get_unique_slug(Page(title="Foo", slug="foo"), parent) == "foo"
+
+
+def test_slug_generated_from_title(parent):
+    add_children(parent, "foo-bar")
+    assert get_unique_slug(Page(title="Foo Bar"), parent) == "foo-bar-2"
+
+
+def test_collision(parent):
+    add_children(parent, "foo")
+    assert get_unique_slug(Page(title="Foo", slug="foo"), parent) == "foo-2"
+
+
+def test_collisions_with_gaps(parent):
+    add_children(parent, "foo", "foo-3")
+    assert get_unique_slug(Page(title="Foo", slug="foo"), parent) == "foo-2"
+    add_children(parent, "foo-2")
+    assert get_unique_slug(Page(title="Foo", slug="foo"), parent) == "foo-4"
+
+
+def test_shared_prefix_without_numeric_suffix(parent):
+    add_children(parent, "foo-bar")
+    assert get_unique_slug(Page(title="Foo", slug="foo"), parent) == "foo"
+    add_children(parent, "foo", "foo-2")
+    assert get_unique_slug(Page(title="Foo", slug="foo"), parent) == "foo-3"
+
+
+def test_only_siblings_considered(parent):
+    other_parent = parent.add_child(instance=Page(title="Other", slug="other"))
+    add_children(other_parent, "foo")
+    assert get_unique_slug(Page(title="Foo", slug="foo"), parent) == "foo"
+
+
+def test_existing_page_ignores_own_slug(parent):
+    add_children(parent, "foo")
+    page = parent.get_children().get(slug="foo")
+    assert get_unique_slug(page, parent) == "foo"
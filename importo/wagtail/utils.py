@@ -1,4 +1,8 @@
+import json
+from typing import Any
+
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.http import HttpRequest
 from django.utils.text import slugify
 from wagtail.models import Page, Site
@@ -25,12 +29,29 @@ def get_dummy_request(path: str = "/", site: Site = None) -> HttpRequest:
 def get_unique_slug(page: Page, parent_page: Page) -> str:
     allow_unicode = getattr(settings, "WAGTAIL_ALLOW_UNICODE_SLUGS", True)
     base_slug = page.slug or slugify(page.title, allow_unicode=allow_unicode)
+    if parent_page is None:
+        return base_slug
+
+    # Fetch all potentially conflicting sibling slugs in a single query, rather
+    # than checking each candidate with Page._slug_is_available()
+    siblings = parent_page.get_children()
+    if page.id:
+        siblings = siblings.not_page(page)
+    taken_slugs = set(
+        siblings.filter(slug__startswith=base_slug).values_list("slug", flat=True)
+    )
+
     candidate_slug = base_slug
     suffix = 1
-    while not Page._slug_is_available(
-        candidate_slug, parent_page, page if page.id else None
-    ):
+    while candidate_slug in taken_slugs:
         # increment suffix until an available slug is found
         suffix += 1
         candidate_slug = "%s-%d" % (base_slug, suffix)
     return candidate_slug
+
+
+def dump(value: Any) -> str:
+    """
+    Return ``value`` as indented JSON, for including raw data in log messages.
+    """
+    return json.dumps(value, indent=2, cls=DjangoJSONEncoder)